@@ -5,10 +5,22 @@ Crawler Module
 爬虫模块统一接口
 """
 
-from crawler.base_scraper import BaseWebScraper
-from crawler.crawler_registry import CrawlerRegistry, CrawlerType, get_global_registry
-from crawler.proxy_pool import ProxyPool, get_global_proxy_pool, init_proxy_pool
-from crawler.utils import setup_logger, get_current_timestamp
+import importlib
+
+# 导出名 -> 所在子模块。按需导入（PEP 562），只使用注册中心时不会加载bs4/httpx等解析与网络依赖
+_LAZY_EXPORTS = {
+    'BaseWebScraper': 'crawler.base_scraper',
+    'CrawlerRegistry': 'crawler.crawler_registry',
+    'CrawlerType': 'crawler.crawler_registry',
+    'get_global_registry': 'crawler.crawler_registry',
+    'ProxyPool': 'crawler.proxy_pool',
+    'get_global_proxy_pool': 'crawler.proxy_pool',
+    'init_proxy_pool': 'crawler.proxy_pool',
+    'get_shared_client': 'crawler.http_pool',
+    'release_shared_client': 'crawler.http_pool',
+    'setup_logger': 'crawler.utils',
+    'get_current_timestamp': 'crawler.utils',
+}
 
 __all__ = [
     # 基础类
@@ -24,6 +36,10 @@ __all__ = [
     'get_global_proxy_pool',
     'init_proxy_pool',
     
+    # HTTP客户端池
+    'get_shared_client',
+    'release_shared_client',
+    
     # 工具函数
     'setup_logger',
     'get_current_timestamp',
@@ -31,3 +47,17 @@ __all__ = [
 
 __version__ = '1.0.0'
 
+
+def __getattr__(name):
+    """首次访问导出名时才导入对应子模块，并缓存到包命名空间"""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
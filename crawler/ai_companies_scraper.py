@@ -11,7 +11,6 @@ import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from crawler.base_scraper import BaseWebScraper
@@ -21,6 +20,15 @@ from crawler import utils
 
 logger = utils.setup_logger()
 
+# class包含content的正文容器元素
+_CONTENT_CLASS_RE = re.compile(r'content', re.I)
+# class包含author的作者元素
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+# class包含date/timestamp/published的日期元素
+_DATE_CLASS_RE = re.compile(r'date|timestamp|published', re.I)
+# class包含news/article/post/item的列表项容器元素
+_LIST_CLASS_RE = re.compile(r'news|article|post|item', re.I)
+
 
 class NVIDIAScraper(BaseWebScraper):
     """NVIDIA新闻爬虫"""
@@ -28,7 +36,9 @@ class NVIDIAScraper(BaseWebScraper):
     def __init__(self):
         super().__init__(
             base_url="https://nvidianews.nvidia.com/",
-            company_name="nvidia"
+            company_name="nvidia",
+            requests_per_minute=30,
+            rate_limit_burst=1,
         )
     
     async def get_article_detail(self, article_id: str, url: str) -> Optional[Dict]:
@@ -39,7 +49,7 @@ class NVIDIAScraper(BaseWebScraper):
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             
             article = {
                 'article_id': article_id,
@@ -50,7 +60,7 @@ class NVIDIAScraper(BaseWebScraper):
             
             # Title
             title_elem = soup.find('h1')
-            article['title'] = self.clean_text(title_elem.get_text()) if title_elem else ''
+            article['title'] = self.element_text(title_elem) if title_elem else ''
             
             # Content
             content_elem = soup.find('div', class_='article-content')
@@ -62,8 +72,8 @@ class NVIDIAScraper(BaseWebScraper):
             article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
             
             # Reference Links
-            reference_links = self.extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
             
             # Publish Time
             # NVIDIA news usually has date in a div/span with class 'date' or 'timestamp'
@@ -90,7 +100,7 @@ class NVIDIAScraper(BaseWebScraper):
             # 3. Try HTML elements
             if not time_str:
                 # Look for date in header or specific classes
-                date_elem = soup.find(class_=lambda x: x and any(c in str(x).lower() for c in ['date', 'timestamp', 'published']))
+                date_elem = soup.find(class_=_DATE_CLASS_RE)
                 if date_elem:
                     time_str = date_elem.get_text(strip=True)
             
@@ -112,7 +122,7 @@ class NVIDIAScraper(BaseWebScraper):
                 return None
                 
             article['publish_time'] = publish_ts
-            article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+            article['publish_date'] = utils.format_date(publish_ts)
             
             # Other fields
             article['description'] = article['content'][:200]
@@ -137,25 +147,25 @@ class NVIDIAScraper(BaseWebScraper):
             if not html:
                 return []
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             articles = []
+            # 同一篇文章可能被多个嵌套容器匹配到，去重后避免重复抓取详情
+            seen_article_ids = set()
             
-            article_elements = soup.find_all(['article', 'div'], class_=lambda x: x and any(
-                keyword in str(x).lower() for keyword in ['news', 'article', 'post', 'item']
-            ))
+            # 只处理前20个元素，找够后即停止遍历文档
+            article_elements = soup.find_all(['article', 'div'], class_=_LIST_CLASS_RE, limit=20)
             
             logger.info(f"Found {len(article_elements)} potential article elements")
             
-            for elem in article_elements[:20]:
+            for elem in article_elements:
                 try:
                     link_elem = elem.find('a', href=True)
                     if not link_elem:
                         continue
                     
                     url = link_elem.get('href', '')
-                    if url.startswith('/'):
-                        url = 'https://nvidianews.nvidia.com' + url
-                    elif not url.startswith('http'):
+                    url = self.resolve_list_url(url)
+                    if not url:
                         continue
                     
                     article_id = self.extract_article_id(url)
@@ -165,11 +175,15 @@ class NVIDIAScraper(BaseWebScraper):
                     title_elem = elem.find(['h1', 'h2', 'h3', 'h4'])
                     if not title_elem:
                         title_elem = link_elem
-                    title = self.clean_text(title_elem.get_text())
+                    title = self.element_text(title_elem)
                     
                     if not title or len(title) < 5:
                         continue
                     
+                    if article_id in seen_article_ids:
+                        continue
+                    seen_article_ids.add(article_id)
+                    
                     articles.append({
                         'article_id': f"nvidia_{article_id}",
                         'title': title[:500],
@@ -198,7 +212,9 @@ async def get_generic_article_detail(scraper: BaseWebScraper, article_id: str, u
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = scraper.make_soup(html)
+        # 标题、正文、描述等元素一次遍历取出
+        page = scraper.collect_page_elements(soup)
         
         article = {
             'article_id': article_id,
@@ -208,36 +224,34 @@ async def get_generic_article_detail(scraper: BaseWebScraper, article_id: str, u
         }
         
         # 标题
-        title_elem = soup.find('h1')
+        title_elem = page.get('h1')
         if not title_elem:
-            title_elem = soup.find('title')
+            title_elem = page.get('title')
             article['title'] = title_elem.get_text(strip=True).split('|')[0].strip() if title_elem else ''
         else:
-            article['title'] = scraper.clean_text(title_elem.get_text())
+            article['title'] = scraper.element_text(title_elem)
         
         # 内容
-        content_elem = soup.find('article')
+        content_elem = page.get('article')
         if not content_elem:
-            content_elem = soup.find(['div', 'main'], class_=lambda x: x and 'content' in str(x).lower())
+            content_elem = soup.find(['div', 'main'], class_=_CONTENT_CLASS_RE)
         if not content_elem:
-            content_elem = soup.find('main')
+            content_elem = page.get('main')
         
         article['content'] = scraper.clean_text(content_elem.get_text()) if content_elem else ''
         
         # 提取参考链接
-        reference_links = scraper.extract_reference_links(soup, content_elem)
-        article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+        reference_links = await scraper.extract_reference_links_async(soup, content_elem)
+        article['reference_links'] = scraper.dump_json(reference_links)
         
         # 描述
-        desc_elem = soup.find('meta', attrs={'name': 'description'})
-        if not desc_elem:
-            desc_elem = soup.find('meta', attrs={'property': 'og:description'})
+        desc_elem = page.get('description') or page.get('og:description')
         article['description'] = desc_elem.get('content', '')[:500] if desc_elem else article['content'][:200]
         
         # 作者
-        author_elem = soup.find(class_=lambda x: x and 'author' in str(x).lower())
+        author_elem = soup.find(class_=_AUTHOR_CLASS_RE)
         if not author_elem:
-            author_elem = soup.find('meta', attrs={'name': 'author'})
+            author_elem = page.get('author')
             author_text = author_elem.get('content', scraper.company_name) if author_elem else scraper.company_name
         else:
             author_text = scraper.clean_text(author_elem.get_text())
@@ -250,7 +264,7 @@ async def get_generic_article_detail(scraper: BaseWebScraper, article_id: str, u
         # 发布时间
         time_elem = soup.find('time')
         if not time_elem:
-            time_elem = soup.find('meta', attrs={'property': 'article:published_time'})
+            time_elem = page.get('article:published_time')
             time_str = time_elem.get('content') if time_elem else ''
         else:
             time_str = time_elem.get('datetime', '') or time_elem.get_text(strip=True)
@@ -263,7 +277,7 @@ async def get_generic_article_detail(scraper: BaseWebScraper, article_id: str, u
             logger.warning(f"Skip article {article_id}: cannot parse publish time: {time_str}")
             return None
         article['publish_time'] = publish_ts
-        article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+        article['publish_date'] = utils.format_date(publish_ts)
         
         # 其他字段
         article['category'] = 'AI资讯'
@@ -336,8 +350,6 @@ async def run_nvidia_crawler(days: int = 7):
 
                     await save_company_article_to_db(article)
                 
-                await asyncio.sleep(2)
-                
             except Exception as e:
                 logger.error(f"Error processing NVIDIA article: {e}")
                 continue
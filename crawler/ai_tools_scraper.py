@@ -6,12 +6,9 @@ AI Tools Blog Scraper
 """
 
 import asyncio
-import json
 import re
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from crawler.base_scraper import BaseWebScraper
@@ -21,6 +18,25 @@ from crawler import utils
 
 logger = utils.setup_logger()
 
+# class包含author的作者元素
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+# class包含tag的标签元素
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+# class包含post/article/blog/card/item/entry/content的列表项容器元素
+_LIST_CLASS_RE = re.compile(r'post|article|blog|card|item|entry|content', re.I)
+# class包含time/date/publish的发布时间元素
+_TIME_CLASS_RE = re.compile(r'time|date|publish', re.I)
+# class包含categor的分类元素
+_CATEGORY_CLASS_RE = re.compile(r'categor', re.I)
+# class包含content的正文容器元素
+_CONTENT_CLASS_RE = re.compile(r'content', re.I)
+# class包含post的正文容器元素
+_POST_CLASS_RE = re.compile(r'post', re.I)
+# 锚点、脚本、邮件、PDF和图片等非内容链接
+_SKIP_URL_RE = re.compile('|'.join(map(re.escape, ('#', 'javascript:', 'mailto:', '.pdf', '.jpg', '.png'))))
+# 指向文章页的链接
+_ARTICLE_HREF_RE = re.compile(r'/blog/|/post/|/article/|/news/')
+
 
 class GenericBlogScraper(BaseWebScraper):
     """通用博客爬虫，适用于大多数博客网站"""
@@ -46,31 +62,28 @@ class GenericBlogScraper(BaseWebScraper):
             if not html:
                 return []
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             articles = []
+            # 同一篇文章可能被多个嵌套容器匹配到，去重后避免重复抓取详情
+            seen_article_ids = set()
             
-            # 尝试多种常见的文章容器选择器
+            # 尝试多种常见的文章容器选择器（只处理前30个元素，找够后即停止遍历文档）
             article_elements = []
             
             # 1. 查找 article 标签
-            article_elements = soup.find_all('article')
+            article_elements = soup.find_all('article', limit=30)
             
             # 2. 如果没找到，查找常见的博客容器类名
             if not article_elements:
-                article_elements = soup.find_all(['div', 'li'], class_=lambda x: x and any(
-                    keyword in str(x).lower() for keyword in 
-                    ['post', 'article', 'blog', 'card', 'item', 'entry', 'content']
-                ))
+                article_elements = soup.find_all(['div', 'li'], class_=_LIST_CLASS_RE, limit=30)
             
             # 3. 如果还是没找到，查找包含链接的容器
             if not article_elements:
-                article_elements = soup.find_all('a', href=lambda x: x and any(
-                    pattern in x for pattern in ['/blog/', '/post/', '/article/', '/news/']
-                ))
+                article_elements = soup.find_all('a', href=_ARTICLE_HREF_RE, limit=30)
             
             logger.info(f"Found {len(article_elements)} potential article elements")
             
-            for elem in article_elements[:30]:
+            for elem in article_elements:
                 try:
                     # 查找链接
                     if elem.name == 'a':
@@ -85,19 +98,11 @@ class GenericBlogScraper(BaseWebScraper):
                     if not url:
                         continue
                     
-                    # 处理相对路径
-                    if url.startswith('/'):
-                        # 从 base_url 提取域名
-                        from urllib.parse import urlparse
-                        parsed = urlparse(self.base_url)
-                        base_domain = f"{parsed.scheme}://{parsed.netloc}"
-                        url = base_domain + url
-                    elif not url.startswith('http'):
-                        # 如果是相对路径但不以 / 开头，拼接到 base_url
-                        url = self.base_url.rstrip('/') + '/' + url
+                    # 处理相对路径：不以 / 开头的相对路径拼接到 base_url
+                    url = self.resolve_list_url(url) or self.base_url.rstrip('/') + '/' + url
                     
                     # 过滤非内容链接
-                    if any(skip in url.lower() for skip in ['#', 'javascript:', 'mailto:', '.pdf', '.jpg', '.png']):
+                    if _SKIP_URL_RE.search(url.lower()):
                         continue
                     
                     article_id = self.extract_article_id(url)
@@ -109,13 +114,17 @@ class GenericBlogScraper(BaseWebScraper):
                     if not title_elem:
                         title_elem = link_elem
                     
-                    title = self.clean_text(title_elem.get_text())
+                    title = self.element_text(title_elem)
                     if not title:
                         title = link_elem.get('title', '')
                     
                     if not title or len(title) < 5:
                         continue
                     
+                    if article_id in seen_article_ids:
+                        continue
+                    seen_article_ids.add(article_id)
+                    
                     articles.append({
                         'article_id': f"{self.company_name}_{article_id}",
                         'title': title[:500],
@@ -142,7 +151,9 @@ class GenericBlogScraper(BaseWebScraper):
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
+            # 标题、正文、描述等元素一次遍历取出
+            page = self.collect_page_elements(soup)
             
             article = {
                 'article_id': article_id,
@@ -152,47 +163,39 @@ class GenericBlogScraper(BaseWebScraper):
             }
             
             # 标题
-            title_elem = soup.find('h1')
+            title_elem = page.get('h1')
             if not title_elem:
-                title_elem = soup.find('title')
+                title_elem = page.get('title')
                 if title_elem:
                     article['title'] = title_elem.get_text(strip=True).split('|')[0].strip()
                 else:
                     article['title'] = ''
             else:
-                article['title'] = self.clean_text(title_elem.get_text())
+                article['title'] = self.element_text(title_elem)
             
             # 内容 - 尝试多种选择器
-            content_elem = None
-            for selector in [
-                {'name': 'article'},
-                {'name': 'div', 'class_': lambda x: x and 'content' in str(x).lower()},
-                {'name': 'div', 'class_': lambda x: x and 'post' in str(x).lower()},
-                {'name': 'main'},
-            ]:
-                content_elem = soup.find(**selector)
-                if content_elem:
-                    break
+            content_elem = (page.get('article')
+                            or soup.find('div', class_=_CONTENT_CLASS_RE)
+                            or soup.find('div', class_=_POST_CLASS_RE)
+                            or page.get('main'))
             
             article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
             
             # 提取参考链接
-            reference_links = self.extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
             
             # 描述
-            desc_elem = soup.find('meta', attrs={'name': 'description'})
-            if not desc_elem:
-                desc_elem = soup.find('meta', attrs={'property': 'og:description'})
+            desc_elem = page.get('description') or page.get('og:description')
             if desc_elem:
                 article['description'] = desc_elem.get('content', '')[:500]
             else:
                 article['description'] = article['content'][:200]
             
             # 作者
-            author_elem = soup.find(['span', 'div', 'a'], class_=lambda x: x and 'author' in str(x).lower())
+            author_elem = soup.find(['span', 'div', 'a'], class_=_AUTHOR_CLASS_RE)
             if not author_elem:
-                author_elem = soup.find('meta', attrs={'name': 'author'})
+                author_elem = page.get('author')
                 article['author'] = author_elem.get('content', self.company_name) if author_elem else self.company_name
             else:
                 article['author'] = self.clean_text(author_elem.get_text()) or self.company_name
@@ -200,9 +203,7 @@ class GenericBlogScraper(BaseWebScraper):
             # 发布时间
             time_elem = soup.find('time')
             if not time_elem:
-                time_elem = soup.find(['span', 'div'], class_=lambda x: x and any(
-                    t in str(x).lower() for t in ['time', 'date', 'publish']
-                ))
+                time_elem = soup.find(['span', 'div'], class_=_TIME_CLASS_RE)
             
             publish_ts = None
             if time_elem:
@@ -210,7 +211,7 @@ class GenericBlogScraper(BaseWebScraper):
                 publish_ts = self.parse_timestamp(time_str) if time_str else None
             else:
                 # 尝试从meta标签获取
-                time_meta = soup.find('meta', attrs={'property': 'article:published_time'})
+                time_meta = page.get('article:published_time')
                 if time_meta:
                     time_str = time_meta.get('content', '')
                     publish_ts = self.parse_timestamp(time_str) if time_str else None
@@ -220,26 +221,26 @@ class GenericBlogScraper(BaseWebScraper):
                 return None
             
             article['publish_time'] = publish_ts
-            article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+            article['publish_date'] = utils.format_date(publish_ts)
             
             # 分类
-            cat_elem = soup.find(['span', 'a'], class_=lambda x: x and 'categor' in str(x).lower())
+            cat_elem = soup.find(['span', 'a'], class_=_CATEGORY_CLASS_RE)
             article['category'] = self.clean_text(cat_elem.get_text()) if cat_elem else 'AI资讯'
             
             # 标签
             tags = []
-            for tag_elem in soup.find_all(['a', 'span'], class_=lambda x: x and 'tag' in str(x).lower()):
+            for tag_elem in soup.find_all(['a', 'span'], class_=_TAG_CLASS_RE):
                 tag_text = self.clean_text(tag_elem.get_text())
                 if tag_text and len(tag_text) < 50:
                     tags.append(tag_text)
-            article['tags'] = json.dumps(tags, ensure_ascii=False) if tags else ''
+            article['tags'] = self.dump_json(tags)
             
             # 封面图片
-            img_elem = soup.find('meta', attrs={'property': 'og:image'})
+            img_elem = page.get('og:image')
             if img_elem:
                 article['cover_image'] = img_elem.get('content', '')
             else:
-                img_elem = soup.find('img')
+                img_elem = page.get('img')
                 article['cover_image'] = img_elem.get('src', '') if img_elem else ''
             
             # 其他字段
@@ -6,13 +6,11 @@ Crawls articles from https://www.aibase.com/zh/daily
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from crawler.base_scraper import BaseWebScraper
@@ -22,13 +20,29 @@ from crawler import utils
 
 logger = utils.setup_logger()
 
+# 新闻/文章页链接（如 /zh/news/...、/zh/article/...）
+_ARTICLE_PATH_RE = re.compile('|'.join(map(re.escape, ('/zh/news/', '/zh/article/', '/news/', '/article/'))))
+# 分页、标签、分类等非文章链接
+_NON_ARTICLE_HREF_RE = re.compile('|'.join(map(re.escape, ('page=', 'tag', 'category'))))
+# 详情页各字段所在元素的class
+_TITLE_CLASS_RE = re.compile(r'title', re.I)
+_CONTENT_CLASS_RE = re.compile(r'content|article|detail', re.I)
+# 正文中的相关推荐、分享、广告等无关区域
+_IRRELEVANT_CLASS_RE = re.compile(r'related|share|ad|recommend', re.I)
+_TIME_CLASS_RE = re.compile(r'time|date|pub', re.I)
+_AUTHOR_CLASS_RE = re.compile(r'author|user', re.I)
+_COVER_CLASS_RE = re.compile(r'cover|thumb', re.I)
+_TAG_CLASS_RE = re.compile(r'tag|label', re.I)
+
 class AibaseWebScraper(BaseWebScraper):
     """Scraper for AIbase website."""
     
     def __init__(self):
         super().__init__(
             base_url="https://www.aibase.com",
-            company_name="aibase"
+            company_name="aibase",
+            requests_per_minute=30,
+            rate_limit_burst=1,
         )
     
     async def get_article_list(self, page: int = 1) -> List[Dict]:
@@ -49,7 +63,7 @@ class AibaseWebScraper(BaseWebScraper):
             if not html:
                 return []
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             articles = []
             
             # Find daily report blocks
@@ -75,11 +89,11 @@ class AibaseWebScraper(BaseWebScraper):
                 
                 # Filter for news/article links
                 # Valid patterns: /zh/news/..., /zh/article/...
-                if not any(p in href for p in ['/zh/news/', '/zh/article/', '/news/', '/article/']):
+                if not _ARTICLE_PATH_RE.search(href):
                     continue
                 
                 # Skip pagination or tag links
-                if any(p in href for p in ['page=', 'tag', 'category']):
+                if _NON_ARTICLE_HREF_RE.search(href):
                     continue
 
                 full_url = urljoin(self.base_url, href)
@@ -119,7 +133,7 @@ class AibaseWebScraper(BaseWebScraper):
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             
             article = {
                 'article_id': article_id,
@@ -129,9 +143,9 @@ class AibaseWebScraper(BaseWebScraper):
             # Title
             title_elem = soup.find('h1')
             if not title_elem:
-                title_elem = soup.find(class_=re.compile(r'title', re.I))
+                title_elem = soup.find(class_=_TITLE_CLASS_RE)
             
-            article['title'] = self.clean_text(title_elem.get_text()) if title_elem else ''
+            article['title'] = self.element_text(title_elem) if title_elem else ''
             if not article['title']:
                 # Fallback to title tag
                 title_tag = soup.find('title')
@@ -142,22 +156,22 @@ class AibaseWebScraper(BaseWebScraper):
             article['source_keyword'] = 'aibase'
 
             # Content
-            content_elem = soup.find(class_=re.compile(r'content|article|detail', re.I))
+            content_elem = soup.find(class_=_CONTENT_CLASS_RE)
             # Refine content selection to avoid headers/footers
             if content_elem:
                 # Remove ads or related posts if possible
-                for irrelevant in content_elem.find_all(class_=re.compile(r'related|share|ad|recommend', re.I)):
+                for irrelevant in content_elem.find_all(class_=_IRRELEVANT_CLASS_RE):
                     irrelevant.decompose()
             
             article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
             
             # Reference links
-            reference_links = self.extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
             
             # Publish Time
             # Look for time element
-            time_elem = soup.find(['time', 'span', 'div'], class_=re.compile(r'time|date|pub', re.I))
+            time_elem = soup.find(['time', 'span', 'div'], class_=_TIME_CLASS_RE)
             time_str = ''
             if time_elem:
                 time_str = time_elem.get_text(strip=True)
@@ -172,7 +186,7 @@ class AibaseWebScraper(BaseWebScraper):
                 publish_ts = self.parse_timestamp(time_str)
                 if publish_ts:
                     article['publish_time'] = publish_ts
-                    article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+                    article['publish_date'] = utils.format_date(publish_ts)
                 else:
                     # Fallback to current time if parse failed but we want to keep it?
                     # Better to log warning
@@ -192,11 +206,11 @@ class AibaseWebScraper(BaseWebScraper):
                 article['description'] = article['content'][:200]
             
             # Author
-            author_elem = soup.find(class_=re.compile(r'author|user', re.I))
+            author_elem = soup.find(class_=_AUTHOR_CLASS_RE)
             article['author'] = self.clean_text(author_elem.get_text()) if author_elem else 'AIbase'
             
             # Cover Image
-            img_elem = soup.find(class_=re.compile(r'cover|thumb', re.I))
+            img_elem = soup.find(class_=_COVER_CLASS_RE)
             if img_elem and img_elem.name == 'img':
                  article['cover_image'] = img_elem.get('src', '')
             elif img_elem:
@@ -212,11 +226,11 @@ class AibaseWebScraper(BaseWebScraper):
 
             # Category/Tags
             tags = []
-            for tag in soup.find_all(class_=re.compile(r'tag|label', re.I)):
+            for tag in soup.find_all(class_=_TAG_CLASS_RE):
                 t = self.clean_text(tag.get_text())
                 if t and t not in tags:
                     tags.append(t)
-            article['tags'] = json.dumps(tags, ensure_ascii=False) if tags else ''
+            article['tags'] = self.dump_json(tags)
             
             # Defaults
             article['read_count'] = 0
@@ -296,7 +310,6 @@ async def run_crawler(days=3):
                     continue
                     
                 await save_article_to_db(article)
-                await asyncio.sleep(2)  # Polite delay
                 
             except Exception as e:
                 logger.error(f"Error processing {article_item['article_id']}: {e}")
@@ -12,7 +12,6 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from crawler.base_scraper import BaseWebScraper
@@ -22,13 +21,19 @@ from database.db_session import get_session
 
 logger = utils.setup_logger()
 
+# 常见的正文容器class
+_CONTENT_CLASS_RE = re.compile('|'.join((
+    'article-content', 'post-content', 'detail-content', 'content', 'main-text', 'post-content')), re.I)
+
 class BaaiHubScraper(BaseWebScraper):
     """Scraper for BAAI Hub website."""
     
     def __init__(self):
         super().__init__(
             base_url="https://hub.baai.ac.cn",
-            company_name="baai_hub"
+            company_name="baai_hub",
+            requests_per_minute=60,
+            rate_limit_burst=1,
         )
         self.api_url = "https://hub-api.baai.ac.cn/api/v1/story/list"
     
@@ -253,7 +258,7 @@ class BaaiHubScraper(BaseWebScraper):
                 # Convert HTML content to text if needed, or keep HTML
                 # The base scraper usually expects text, but HTML is fine if we want to preserve structure.
                 # Let's convert to text to be consistent with other scrapers
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = self.make_soup(content)
                 
                 # Extract reference links
                 reference_links = []
@@ -370,7 +375,7 @@ class BaaiHubScraper(BaseWebScraper):
     def _parse_weixin_detail(self, html: str) -> Optional[Dict]:
         """Parse WeChat article detail."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
             
             # Title
             title = ""
@@ -446,7 +451,7 @@ class BaaiHubScraper(BaseWebScraper):
             return nuxt_detail
 
         # 2. Fallback to HTML parsing
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.make_soup(html)
         
         # Title
         title = ""
@@ -460,8 +465,7 @@ class BaaiHubScraper(BaseWebScraper):
         reference_links = []
         
         # Common classes for content
-        content_classes = ['article-content', 'post-content', 'detail-content', 'content', 'main-text', 'post-content']
-        content_div = soup.find('div', class_=re.compile('|'.join(content_classes), re.I))
+        content_div = soup.find('div', class_=_CONTENT_CLASS_RE)
         
         # Specific for BAAI Hub
         if not content_div:
@@ -684,8 +688,6 @@ async def run_crawler(days=3):
                         new_articles_in_page += 1
                     
                     await save_article_to_db(article)
-                    
-                    await asyncio.sleep(1)
                         
                 except Exception as e:
                     logger.error(f"Error processing article {article_item.get('article_id', 'unknown')}: {e}")
@@ -6,21 +6,484 @@ Base Web Scraper
 """
 
 import asyncio
+import importlib.util
 import json
+import random
 import re
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from bs4.builder import ParserRejectedMarkup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax为可选依赖，未安装时使用BeautifulSoup
+    LexborHTMLParser = None
+
+try:
+    import re2 as _url_re_engine  # google-re2：线性时间匹配，长文本扫描URL更快
+except ImportError:  # 可选依赖，未安装时使用标准库re
+    _url_re_engine = re
+
+# lxml为可选依赖，未安装时使用内置html.parser（只检查是否可用，不导入）
+_BS4_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson为可选依赖，未安装时使用标准库json
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
 from crawler import utils
 from crawler.constants import DEFAULT_HEADERS
+from crawler.http_pool import HTTP2_AVAILABLE, get_shared_client, release_shared_client
 
 logger = utils.setup_logger()
 
+# 可重试的4xx状态码（请求超时、Too Early、限流）
+_RETRYABLE_4XX = frozenset({408, 425, 429})
+# 重试退避的最长等待时间（秒），也是服务端Retry-After的上限
+_BACKOFF_MAX_DELAY = 32.0
+
+# 文本中的URL：末尾字符排除标点，避免逐个rstrip
+# 汉字范围直接写字符（一-龥，即U+4E00-U+9FA5），re与re2都能识别
+_URL_RE = _url_re_engine.compile(r'https?://[^\s<>\[\]"\'一-龥]*[^\s<>\[\]"\'一-龥.,;:。，；：]')
+
+# 文章ID提取规则（按优先级）
+_ARTICLE_ID_PATTERNS = (
+    r'/article[s]?/([^/\?]+)',
+    r'/post[s]?/([^/\?]+)',
+    r'/blog/([^/\?]+)',
+    r'/news/([^/\?]+)',
+    r'/research/([^/\?]+)',
+    r'/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})',  # UUID
+    r'/(\d+)',  # 纯数字ID
+)
+# 合并为一个正则：各分支从开头以 .*? 查找，按分支顺序尝试，保持原有的优先级语义
+# （普通的交替会取最靠左的匹配，改变优先级）；每个分支只有一个捕获组，用 lastindex 取值
+_ARTICLE_ID_RE = re.compile('^(?:' + '|'.join(f'.*?{p}' for p in _ARTICLE_ID_PATTERNS) + ')', re.S)
+
+# "刚刚"/"just now"/"now"（'just now'包含'now'，合并为一个模式）
+_TS_NOW_RE = re.compile(r'now|刚刚', re.I)
+# 相对时间和月份年份，一次扫描后按 lastgroup 分派
+_TS_COMBINED_RE = re.compile(
+    r'(?P<minutes>\d+)\s*(?:minute|min|分钟)'
+    r'|(?P<hours>\d+)\s*(?:hour|hr|小时)'
+    r'|(?P<days>\d+)\s*(?:day|天)'
+    r'|(?P<yesterday>昨天|yesterday)'
+    r'|(?P<day_before>前天)'
+    r'|(?P<month_year>(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+    re.I,
+)
+# 相对时间单位对应的秒数
+_TS_REL_SECONDS = {
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+}
+
+# 页面文本中的日期
+# English Month Day, Year
+_DATE_EN_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}', re.IGNORECASE)
+# Month Year (e.g. May 2025) - strict to avoid matching random text
+_MONTH_YEAR_RE = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', re.IGNORECASE)
+# Chinese Date
+_DATE_CN_RE = re.compile(r'\d{4}年\d{1,2}月\d{1,2}日')
+# ISO Date
+_DATE_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_DATE_TEXT_PATTERNS = (_DATE_EN_RE, _DATE_CN_RE, _DATE_ISO_RE, _MONTH_YEAR_RE)
+
+# 可能包含发布时间的meta标签（property或name）
+_META_TIME_PROPS = (
+    'article:published_time',
+    'og:updated_time',
+    'date',
+    'parsely-pub-date',
+    'publish_date',
+)
+_META_TIME_PROP_SET = frozenset(_META_TIME_PROPS)
+# JSON-LD中的日期字段
+_LD_DATE_KEYS = ('datePublished', 'dateCreated', 'dateModified')
+# class包含date的容器（可能包含time标签）
+_DATE_CONTAINER_SELECTOR = 'div[class*="date" i], span[class*="date" i], p[class*="date" i]'
+# 详情页常用元素：collect_page_elements单次遍历收集每种的第一个
+_PAGE_ELEMENT_TAGS = frozenset({'h1', 'title', 'article', 'main', 'img'})
+# 需要收集的meta标签：{属性名: 属性值}
+_PAGE_ELEMENT_METAS = (
+    ('name', frozenset({'description', 'author'})),
+    ('property', frozenset({'og:description', 'og:image', 'article:published_time'})),
+)
+# 元数据区域（class包含meta/info/date/author/time）
+_META_AREA_SELECTOR = ', '.join(
+    f'{tag}[class*="{k}" i]'
+    for tag in ('header', 'div', 'span')
+    for k in ('meta', 'info', 'date', 'author', 'time')
+)
+
+# 参考链接分类（按优先级排列）
+# 按注册域名（含子域名）查表，{域名: 类型}
+_REF_DOMAIN_TYPES = {
+    domain: ref_type
+    for ref_type, domains in (
+        # 论文相关
+        ('paper', ('arxiv.org', 'paperswithcode.com', 'semanticscholar.org', 'acm.org',
+                   'ieee.org', 'nature.com', 'science.org')),
+        # GitHub/代码仓库
+        ('code', ('github.com', 'gitlab.com', 'huggingface.co')),
+        # AI公司官方网站
+        ('official', ('openai.com', 'anthropic.com', 'google.com', 'microsoft.com', 'meta.com',
+                      'nvidia.com', 'apple.com', 'deepmind.com', 'baidu.com', 'alibaba.com')),
+        # 技术博客
+        ('blog', ('medium.com', 'towardsdatascience.com', 'hackernoon.com')),
+        # 社交媒体
+        ('social', ('twitter.com', 'x.com', 'zhihu.com', 'youtube.com', 'bilibili.com')),
+    )
+    for domain in domains
+}
+# 优先于"blog.xxx"子域名判断的类型
+_REF_PRIMARY_TYPES = frozenset({'paper', 'code', 'official'})
+_SHARE_LINK_RE = re.compile(r'share|intent/tweet|sharer')
+
+# 页面条件请求缓存：{URL: (ETag, Last-Modified, 页面内容)}，按LRU淘汰
+_PAGE_CACHE: "OrderedDict[str, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+_PAGE_CACHE_SIZE = 512
+
+def make_soup(html: str) -> BeautifulSoup:
+    """
+    解析HTML（安装了lxml时使用C实现的lxml解析器，比html.parser快数倍）
+    
+    Args:
+        html: 页面HTML
+        
+    Returns:
+        BeautifulSoup对象
+    """
+    try:
+        return BeautifulSoup(html, _BS4_PARSER)
+    except ParserRejectedMarkup:
+        # lxml拒绝严重畸形的HTML时退回容错性更好的html.parser
+        return BeautifulSoup(html, 'html.parser')
+
+def dump_json(obj) -> str:
+    """
+    序列化为JSON字符串（安装orjson时使用orjson），用于保存标签、参考链接等字段
+    
+    Args:
+        obj: 待序列化的对象
+        
+    Returns:
+        JSON字符串（非ASCII字符不转义），obj为空时返回空字符串
+    """
+    return _json_dumps(obj) if obj else ''
+
+def _decode_body(content: bytes, charset: Optional[str]) -> str:
+    """
+    按Content-Type中的charset解码响应体（缺省UTF-8），不做编码探测
+    
+    Args:
+        content: 响应体字节
+        charset: Content-Type中声明的字符集
+        
+    Returns:
+        解码后的文本
+    """
+    try:
+        return content.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        # 服务器声明了Python不认识的字符集
+        return content.decode('utf-8', errors='replace')
+
+
+# 纯数字格式按"形状"（数字串记为0、空白记为单个空格）直接分派，每种形状只对应一个格式
+_TS_FORMATS_BY_SHAPE = {
+    '0-0-0 0:0:0': ('%Y-%m-%d %H:%M:%S',),
+    '0-0-0 0:0': ('%Y-%m-%d %H:%M',),
+    '0-0-0T0:0:0': ('%Y-%m-%dT%H:%M:%S',),
+    '0/0/0 0:0:0': ('%Y/%m/%d %H:%M:%S',),
+    '0年0月0日 0:0:0': ('%Y年%m月%d日 %H:%M:%S',),
+    '0年0月0日': ('%Y年%m月%d日',),
+    '0-0-0': ('%Y-%m-%d',),
+    '0/0/0': ('%Y/%m/%d',),
+}
+_TS_SHAPE_RE = re.compile(r'\d+|\s+')
+# 含月份名的格式，按首字符是否为数字分组
+_TS_DAY_FIRST_FORMATS = (
+    '%d %B %Y',   # 1 January 2024
+    '%d %b %Y',   # 1 Jan 2024
+)
+_TS_ALPHA_FORMATS = (
+    '%B %d, %Y',  # January 1, 2024
+    '%b %d, %Y',  # Jan 1, 2024
+)
+
+
+@lru_cache(maxsize=None)
+def _dateutil_parser():
+    """
+    延迟导入dateutil.parser（只在兜底解析时才需要），结果缓存
+    
+    未安装时也只尝试导入一次，避免每次兜底解析都重新搜索模块路径
+    """
+    try:
+        from dateutil import parser
+    except ImportError:
+        return None
+    return parser
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(time_str: str) -> Tuple[Optional[int], bool]:
+    """
+    解析已去除首尾空白的时间字符串（按原始字符串缓存结果）
+    
+    Args:
+        time_str: 时间字符串
+        
+    Returns:
+        (值, 是否相对时间)：绝对时间返回Unix时间戳，相对时间返回距今秒数；无法解析时值为None
+    """
+    # ISO 8601格式（Python 3.11+ 的 fromisoformat 可直接解析 'Z' 后缀）
+    try:
+        return int(datetime.fromisoformat(time_str).timestamp()), False
+    except ValueError:
+        pass
+    
+    # 处理相对时间
+    if _TS_NOW_RE.search(time_str):
+        return 0, True
+    
+    # N分钟/小时/天前、昨天/前天、Month Year（取最靠前的匹配）
+    match = _TS_COMBINED_RE.search(time_str)
+    if match:
+        kind = match.lastgroup
+        if kind in _TS_REL_SECONDS:
+            return int(match.group(kind)) * _TS_REL_SECONDS[kind], True
+        if kind == 'yesterday':
+            return 86400, True
+        if kind == 'day_before':
+            return 2 * 86400, True
+        # Month Year (e.g. May 2025), default to 1st of month
+        try:
+            dt = datetime.strptime(match.group(kind), '%B %Y')
+            return int(dt.timestamp()), False
+        except ValueError:
+            pass
+
+    # Standard formats
+    # 取前30个字符避免过多垃圾字符，但有些格式较长
+    clean_time_str = time_str[:30].strip()
+    # 按形状/首字符只尝试可能匹配的格式，避免逐个格式抛出ValueError
+    shape = _TS_SHAPE_RE.sub(lambda m: '0' if m.group()[0].isdigit() else ' ', clean_time_str)
+    formats = _TS_FORMATS_BY_SHAPE.get(shape)
+    if formats is None:
+        formats = _TS_DAY_FIRST_FORMATS if clean_time_str[:1].isdigit() else _TS_ALPHA_FORMATS
+    
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(clean_time_str, fmt)
+            return int(dt.timestamp()), False
+        except ValueError:
+            continue
+    
+    # 宽松匹配：提取数字
+    # 例如 "Oct 12, 2024"
+    parser = _dateutil_parser()
+    if parser is not None:
+        try:
+            dt = parser.parse(time_str, fuzzy=True)
+            return int(dt.timestamp()), False
+        except Exception:
+            pass
+
+    return None, False
+
+
+@lru_cache(maxsize=8192)
+def _extract_article_id_cached(url: str) -> Optional[str]:
+    """从URL中提取文章ID（按URL缓存）"""
+    match = _ARTICLE_ID_RE.match(url)
+    if match:
+        return match.group(match.lastindex)
+    
+    # 如果都匹配不到，使用URL的最后一部分
+    parsed = urlparse(url)
+    path_parts = [p for p in parsed.path.split('/') if p]
+    if path_parts:
+        return path_parts[-1].split('.')[0]
+    
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _url_netloc(url: str) -> str:
+    """获取URL的域名部分（按URL缓存）"""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=8192)
+def _classify_url(url: str) -> Optional[str]:
+    """分类参考链接（按URL缓存）"""
+    try:
+        host = urlparse(url).hostname or ''
+    except ValueError:
+        host = ''
+    
+    # 从完整主机名逐级去掉子域名查表，例如 www.blog.google.com -> blog.google.com -> google.com
+    labels = host.split('.')
+    ref_type = None
+    for i in range(len(labels) - 1):
+        ref_type = _REF_DOMAIN_TYPES.get('.'.join(labels[i:]))
+        if ref_type:
+            break
+    
+    if ref_type in _REF_PRIMARY_TYPES:
+        return ref_type
+    # blog.xxx / xxxblog.com 等博客子域名
+    if any(label.endswith('blog') for label in labels[:-1]):
+        return 'blog'
+    if ref_type:
+        # 排除社交媒体分享按钮
+        if ref_type == 'social' and _SHARE_LINK_RE.search(url.lower()):
+            return None
+        return ref_type
+    
+    # 其他外部链接
+    if url.startswith('http'):
+        return 'external'
+    
+    return None
+
+
+def _find_ld_date(obj) -> Optional[str]:
+    """
+    深度优先查找JSON-LD中的发布日期
+    
+    使用迭代器栈代替递归，遍历顺序与递归实现一致：
+    字典中先出现的键（包括其嵌套内容）优先。
+    """
+    stack = [iter(((None, obj),))]
+    while stack:
+        for k, v in stack[-1]:
+            if k in _LD_DATE_KEYS:
+                if v:
+                    return v
+                # 日期字段为空时跳过该对象的其余字段
+                stack.pop()
+                break
+            if isinstance(v, dict):
+                stack.append(iter(v.items()))
+                break
+            if isinstance(v, list):
+                stack.append(((None, item) for item in v))
+                break
+        else:
+            stack.pop()
+    return None
+
+
+def _pick_meta_time(metas) -> str:
+    """
+    一次遍历所有meta标签，按_META_TIME_PROPS的优先级选出发布时间
+    
+    每个名称优先使用property属性匹配的第一个标签，其次是name属性；
+    该标签content为空时继续尝试下一个名称。
+    
+    Args:
+        metas: meta标签属性字典的可迭代对象
+        
+    Returns:
+        时间字符串，未找到时返回空字符串
+    """
+    found = {}
+    for attrs in metas:
+        for rank, attr in enumerate(('property', 'name')):
+            key = attrs.get(attr)
+            if key in _META_TIME_PROP_SET and found.get(key, (2,))[0] > rank:
+                found[key] = (rank, attrs.get('content') or '')
+        # 最高优先级的property标签已找到且有内容，不必继续遍历
+        top = found.get(_META_TIME_PROPS[0])
+        if top and top[0] == 0 and top[1]:
+            break
+    for prop in _META_TIME_PROPS:
+        if prop in found and found[prop][1]:
+            return found[prop][1]
+    return ''
+
+
+def _pick_time_text(dt_attr: str, text_content: str) -> str:
+    """在time标签的datetime属性和文本之间选择时间字符串"""
+    # 如果datetime属性只包含年月（如May 2025），且文本包含更详细日期，优先用文本
+    if dt_attr and len(dt_attr) < 10 and len(text_content) > len(dt_attr):
+        return text_content
+    return dt_attr or text_content
+
+
+def _leading_text(elem, limit: int) -> str:
+    """获取元素开头limit个字符的文本，够长即停止遍历，避免拼接整页文本"""
+    parts = []
+    size = 0
+    for text in elem.strings:
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
+def _search_date_text(text: str) -> Optional[str]:
+    """按优先级在文本中查找日期"""
+    for pattern in _DATE_TEXT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析Retry-After响应头（只支持秒数形式）"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    """异步令牌桶限流：每period秒最多rate个请求，空闲后允许突发到burst个（默认rate个）"""
+    
+    def __init__(self, rate: float, period: float = 60.0, burst: Optional[float] = None):
+        self.capacity = burst if burst is not None else rate
+        self.tokens = self.capacity
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """获取一个令牌，不足时等待补充"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
 
 class BaseWebScraper(ABC):
     """网页爬虫基类"""
@@ -32,7 +495,15 @@ class BaseWebScraper(ABC):
         use_proxy: bool = False,
         timeout: int = 30,
         max_retries: int = 3,
-        http2: bool = False,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = 1000,
+        max_keepalive_connections: Optional[int] = 100,
+        keepalive_expiry: Optional[float] = 30.0,
+        hedge_after: Optional[float] = None,
+        hedge_max: int = 2,
+        max_concurrency: int = 64,
+        requests_per_minute: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
     ):
         """
         初始化爬虫
@@ -43,8 +514,22 @@ class BaseWebScraper(ABC):
             use_proxy: 是否使用代理
             timeout: 请求超时时间（秒）
             max_retries: 最大重试次数
+            http2: 是否启用HTTP/2，默认在安装了h2时启用
+            max_connections: 连接池最大连接数（None为不限制）
+            max_keepalive_connections: 最大keep-alive连接数，少量域名高并发时可调大以减少重复握手
+            keepalive_expiry: 空闲keep-alive连接的保留时间（秒）
+            hedge_after: 请求超过该秒数未返回时并发发起备份请求，默认为超时时间的1/3
+            hedge_max: 单次获取最多同时进行的请求数，设为1关闭备份请求
+            max_concurrency: fetch_page同时进行的最大请求数（子类无需再自行创建信号量）
+            requests_per_minute: fetch_page每分钟最多发起的请求数（令牌桶限流，None为不限制）
+            rate_limit_burst: 令牌桶容量，即空闲后（包括启动时）可连续发出的请求数，默认等于requests_per_minute；
+                设为1时请求严格按 60/requests_per_minute 秒的间隔发出
         """
         self.base_url = base_url
+        # 站内链接过滤用的域名与拼接站内路径用的站点根，只解析一次
+        parsed_base = urlparse(base_url)
+        self._base_netloc = parsed_base.netloc.lower()
+        self._base_origin = f"{parsed_base.scheme}://{parsed_base.netloc}"
         self.company_name = company_name
         self.use_proxy = use_proxy
         self.timeout = timeout
@@ -52,17 +537,40 @@ class BaseWebScraper(ABC):
         self.headers = DEFAULT_HEADERS.copy()
         self.session: Optional[httpx.AsyncClient] = None
         self.proxy_pool = None
-        self.http2 = http2
+        self._current_proxy: Optional[str] = None
+        self._client_key: Optional[tuple] = None
+        # 本爬虫持有的所有客户端，切换代理时保留旧客户端，切回时可复用已建立的连接
+        self._held_clients: Dict[tuple, httpx.AsyncClient] = {}
+        # HTML解析后端：安装selectolax时extract_list_items使用它，否则回退到BeautifulSoup
+        self._parser_backend = 'selectolax' if LexborHTMLParser is not None else 'bs4'
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.hedge_after = hedge_after if hedge_after is not None else timeout / 3
+        self.hedge_max = max(1, hedge_max)
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = (_TokenBucket(requests_per_minute, burst=rate_limit_burst)
+                              if requests_per_minute else None)
+    
+    def _acquire_session(self, proxy_url: Optional[str]):
+        """从共享池获取对应代理的HTTP客户端"""
+        self._client_key = (
+            proxy_url,
+            self.http2,
+            self.timeout,
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+        )
+        self._current_proxy = proxy_url
+        if self._client_key not in self._held_clients:
+            self._held_clients[self._client_key] = get_shared_client(self._client_key, self.headers)
+        self.session = self._held_clients[self._client_key]
     
     async def init(self):
-        """初始化HTTP客户端"""
-        kwargs = {
-            "headers": self.headers,
-            "timeout": self.timeout,
-            "verify": False,
-            "follow_redirects": True,
-            "http2": self.http2,
-        }
+        """初始化HTTP客户端（同一代理的爬虫共享连接池）"""
+        proxy_url = None
         
         # 如果启用代理，尝试获取代理
         if self.use_proxy:
@@ -70,15 +578,18 @@ class BaseWebScraper(ABC):
             self.proxy_pool = get_global_proxy_pool()
             proxy_dict = self.proxy_pool.get_proxy_dict()
             if proxy_dict:
-                kwargs["proxies"] = proxy_dict
+                proxy_url = proxy_dict.get("https://")
                 logger.info(f"Using proxy for {self.company_name}")
         
-        self.session = httpx.AsyncClient(**kwargs)
+        self._acquire_session(proxy_url)
     
     async def close(self):
-        """关闭HTTP客户端"""
-        if self.session:
-            await self.session.aclose()
+        """释放本爬虫持有的所有HTTP客户端"""
+        held, self._held_clients = self._held_clients, {}
+        self._client_key = None
+        self.session = None
+        for key in held:
+            await release_shared_client(key)
     
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -89,6 +600,115 @@ class BaseWebScraper(ABC):
         """异步上下文管理器出口"""
         await self.close()
     
+    def make_soup(self, html: str) -> BeautifulSoup:
+        """
+        解析HTML（见模块级make_soup）
+        
+        Args:
+            html: 页面HTML
+            
+        Returns:
+            BeautifulSoup对象
+        """
+        return make_soup(html)
+    
+    def resolve_list_url(self, url: str) -> Optional[str]:
+        """
+        把列表页中的链接转为绝对URL
+        
+        Args:
+            url: 链接href
+            
+        Returns:
+            以'/'开头的站内路径拼接站点根后返回，http(s)链接原样返回，其他链接返回None
+        """
+        if url[:1] == '/':
+            return self._base_origin + url
+        if url.startswith(('http://', 'https://')):
+            return url
+        return None
+    
+    def collect_page_elements(self, soup: BeautifulSoup) -> Dict[str, Tag]:
+        """
+        单次遍历文档，收集详情页常用元素（h1、title、article、main、img，
+        以及name/property为description、og:description、author、og:image、article:published_time的meta）各自第一次出现的元素，
+        代替逐个soup.find从根节点重复遍历
+        
+        Args:
+            soup: BeautifulSoup对象
+            
+        Returns:
+            {标签名或meta的name/property值: 元素}，页面中不存在的元素不包含在内
+        """
+        found: Dict[str, Tag] = {}
+        total = len(_PAGE_ELEMENT_TAGS) + sum(len(values) for _, values in _PAGE_ELEMENT_METAS)
+        for elem in soup.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            name = elem.name
+            if name == 'meta':
+                for attr, values in _PAGE_ELEMENT_METAS:
+                    key = elem.get(attr)
+                    if key in values and key not in found:
+                        found[key] = elem
+            elif name in _PAGE_ELEMENT_TAGS and name not in found:
+                found[name] = elem
+            else:
+                continue
+            if len(found) == total:
+                break
+        return found
+    
+    def extract_list_items(self, html: str, class_keywords: Tuple[str, ...], fallback_selector: str,
+                           limit: int = 30) -> List[Tuple[str, str]]:
+        """
+        从列表页提取文章条目（安装selectolax时使用它，否则回退到BeautifulSoup）
+        
+        先查找class包含任一关键词的article/div容器，找不到时使用fallback_selector匹配的链接。
+        
+        Args:
+            html: 列表页HTML
+            class_keywords: 容器class关键词（不区分大小写）
+            fallback_selector: 未找到容器时使用的链接CSS选择器
+            limit: 最多处理的元素数
+            
+        Returns:
+            (链接href, 标题文本) 列表，标题取第一个h1-h4，没有时取链接文本
+        """
+        items = []
+        
+        if self._parser_backend != 'selectolax':
+            soup = self.make_soup(html)
+            class_re = re.compile('|'.join(map(re.escape, class_keywords)), re.I)
+            # 只需前limit个元素，找够后即停止遍历文档
+            elements = soup.find_all(['article', 'div'], class_=class_re, limit=limit)
+            if not elements:
+                elements = soup.select(fallback_selector, limit=limit)
+            logger.info(f"Found {len(elements)} potential article elements")
+            
+            for elem in elements:
+                link_elem = elem if elem.name == 'a' else elem.find('a', href=True)
+                if not link_elem:
+                    continue
+                title_elem = elem.find(['h1', 'h2', 'h3', 'h4']) or link_elem
+                items.append((link_elem.get('href', ''), self.element_text(title_elem)))
+            return items
+        
+        tree = LexborHTMLParser(html)
+        class_filter = ', '.join(f'[class*="{k}" i]' for k in class_keywords)
+        nodes = tree.css(f':is(article, div):is({class_filter})')
+        if not nodes:
+            nodes = tree.css(fallback_selector)
+        logger.info(f"Found {len(nodes)} potential article elements")
+        
+        for node in nodes[:limit]:
+            link_node = node if node.tag == 'a' else node.css_first('a[href]')
+            if not link_node:
+                continue
+            title_node = node.css_first('h1, h2, h3, h4') or link_node
+            items.append((link_node.attributes.get('href') or '', self.clean_text(title_node.text())))
+        return items
+    
     async def fetch_page(self, url: str, **kwargs) -> Optional[str]:
         """
         获取页面内容
@@ -101,38 +721,135 @@ class BaseWebScraper(ABC):
             页面HTML内容，失败返回None
         """
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
-                response = await self.session.get(url, **kwargs)
-                response.raise_for_status()
-                return response.text
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire()
+                # 限制同时进行的请求数（退避等待期间不占用名额）
+                async with self._fetch_semaphore:
+                    return await self._fetch_conditional(url, **kwargs)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                # 4xx（除超时/限流外）重试也不会成功，直接放弃
+                if 400 <= status < 500 and status not in _RETRYABLE_4XX:
+                    logger.error(f"Failed to fetch page {url}: HTTP {status}, not retrying")
+                    return None
+                if status in (429, 503):
+                    retry_after = _parse_retry_after(e.response.headers.get('Retry-After'))
+                logger.error(f"Failed to fetch page {url} (attempt {attempt + 1}/{self.max_retries}): {e}")
             except Exception as e:
                 logger.error(f"Failed to fetch page {url} (attempt {attempt + 1}/{self.max_retries}): {e}")
-                
+            
+            if attempt < self.max_retries - 1:
                 # 如果使用代理且失败，尝试换一个代理
-                if self.use_proxy and self.proxy_pool and attempt < self.max_retries - 1:
+                if self.use_proxy and self.proxy_pool:
                     await self._switch_proxy()
                     await asyncio.sleep(2)
-                    continue
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # 指数退避
+                else:
+                    # 服务端给出Retry-After时按其等待，否则指数退避，加随机抖动避免大量请求同时重试
+                    delay = retry_after if retry_after is not None else (2 ** attempt) * (0.5 + random.random())
+                    await asyncio.sleep(min(delay, _BACKOFF_MAX_DELAY))
         
         return None
     
+    async def _fetch_conditional(self, url: str, **kwargs) -> str:
+        """
+        发起条件请求：携带上次响应的ETag/Last-Modified，返回304时直接使用缓存的页面
+        
+        Args:
+            url: 目标URL
+            **kwargs: 传递给httpx的额外参数
+            
+        Returns:
+            页面HTML内容
+        """
+        cache_key = str(httpx.URL(url, params=kwargs.get('params')))
+        cached = _PAGE_CACHE.get(cache_key)
+        if cached:
+            etag, last_modified, _ = cached
+            headers = dict(kwargs.get('headers') or {})
+            if etag:
+                headers.setdefault('If-None-Match', etag)
+            if last_modified:
+                headers.setdefault('If-Modified-Since', last_modified)
+            kwargs = {**kwargs, 'headers': headers}
+        
+        response = await self._hedged_get(url, **kwargs)
+        if response.status_code == 304 and cached:
+            _PAGE_CACHE.move_to_end(cache_key)
+            logger.debug(f"Page not modified, using cached body: {url}")
+            return cached[2]
+        
+        response.raise_for_status()
+        if self._current_proxy and self.proxy_pool:
+            self.proxy_pool.mark_success(self._current_proxy)
+        
+        text = _decode_body(response.content, response.charset_encoding)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            _PAGE_CACHE[cache_key] = (etag, last_modified, text)
+            _PAGE_CACHE.move_to_end(cache_key)
+            if len(_PAGE_CACHE) > _PAGE_CACHE_SIZE:
+                _PAGE_CACHE.popitem(last=False)
+        return text
+    
+    async def _hedged_get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        发起GET请求，超过hedge_after秒未返回时并发发起备份请求，取最先成功的结果
+        
+        Args:
+            url: 目标URL
+            **kwargs: 传递给httpx的额外参数
+            
+        Returns:
+            最先成功返回的响应；所有请求都失败时抛出第一个异常
+        """
+        async def _backup_get() -> httpx.Response:
+            # 备份请求同样计入限流（首个请求的令牌已在fetch_page中获取）
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            return await self.session.get(url, **kwargs)
+        
+        tasks = {asyncio.ensure_future(self.session.get(url, **kwargs))}
+        launched = 1
+        first_error: Optional[BaseException] = None
+        try:
+            while tasks:
+                wait_timeout = self.hedge_after if launched < self.hedge_max else None
+                done, tasks = await asyncio.wait(
+                    tasks, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 先取出本轮所有已完成任务的异常，避免赢家先返回时失败任务的异常未被读取
+                winner = None
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if winner is None:
+                            winner = task
+                    elif first_error is None:
+                        first_error = error
+                if winner is not None:
+                    return winner.result()
+                if not done:
+                    # 请求过慢，补发一个备份请求；失败则交由fetch_page的重试逻辑处理
+                    tasks.add(asyncio.ensure_future(_backup_get()))
+                    launched += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+        raise first_error
+    
     async def _switch_proxy(self):
         """切换代理"""
         try:
-            # 标记当前代理失败（简化实现）
+            # 标记当前代理失败
+            if self._current_proxy:
+                self.proxy_pool.mark_failed(self._current_proxy)
             new_proxy_dict = self.proxy_pool.get_proxy_dict()
             if new_proxy_dict:
-                await self.session.aclose()
-                self.session = httpx.AsyncClient(
-                    headers=self.headers,
-                    timeout=self.timeout,
-                    verify=False,
-                    follow_redirects=True,
-                    proxies=new_proxy_dict
-                )
+                # 旧代理的客户端保留到close()时再释放，避免反复关闭/重建连接池
+                self._acquire_session(new_proxy_dict.get("https://"))
                 logger.info(f"Switched to new proxy")
         except Exception as e:
             logger.error(f"Failed to switch proxy: {e}")
@@ -151,7 +868,8 @@ class BaseWebScraper(ABC):
         try:
             response = await self.session.get(url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            # 直接解析原始字节（安装orjson时使用orjson），省去先解码为str的步骤
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Failed to fetch JSON {url}: {e}")
             return None
@@ -193,28 +911,7 @@ class BaseWebScraper(ABC):
         Returns:
             文章ID，失败返回None
         """
-        patterns = [
-            r'/article[s]?/([^/\?]+)',
-            r'/post[s]?/([^/\?]+)',
-            r'/blog/([^/\?]+)',
-            r'/news/([^/\?]+)',
-            r'/research/([^/\?]+)',
-            r'/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})',  # UUID
-            r'/(\d+)',  # 纯数字ID
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        # 如果都匹配不到，使用URL的最后一部分
-        parsed = urlparse(url)
-        path_parts = [p for p in parsed.path.split('/') if p]
-        if path_parts:
-            return path_parts[-1].split('.')[0]
-        
-        return None
+        return _extract_article_id_cached(url)
     
     def parse_timestamp(self, time_str: str) -> Optional[int]:
         """
@@ -231,92 +928,11 @@ class BaseWebScraper(ABC):
                 # logger.warning("Publish time missing.")
                 return None
             
-            time_str = time_str.strip()
-            now = datetime.now()
-            
-            # 处理相对时间
-            if any(keyword in time_str.lower() for keyword in ['just now', '刚刚', 'now']):
-                return int(now.timestamp())
-            
-            # 分钟前
-            if re.search(r'(\d+)\s*(minute|min|分钟)', time_str, re.I):
-                match = re.search(r'(\d+)', time_str)
-                minutes = int(match.group(1)) if match else 0
-                return int((now - timedelta(minutes=minutes)).timestamp())
-            
-            # 小时前
-            if re.search(r'(\d+)\s*(hour|hr|小时)', time_str, re.I):
-                match = re.search(r'(\d+)', time_str)
-                hours = int(match.group(1)) if match else 0
-                return int((now - timedelta(hours=hours)).timestamp())
-            
-            # 天前
-            if re.search(r'(\d+)\s*(day|天)', time_str, re.I):
-                match = re.search(r'(\d+)', time_str)
-                days = int(match.group(1)) if match else 0
-                return int((now - timedelta(days=days)).timestamp())
-            
-            # 昨天/前天
-            if '昨天' in time_str or 'yesterday' in time_str.lower():
-                return int((now - timedelta(days=1)).timestamp())
-            if '前天' in time_str:
-                return int((now - timedelta(days=2)).timestamp())
-            
-            # ISO 8601格式
-            if 'T' in time_str and ('Z' in time_str or '+' in time_str or '-' in time_str):
-                try:
-                    # 尝试直接解析 ISO 格式
-                    dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                    return int(dt.timestamp())
-                except:
-                    pass
-            
-            # Month Year (e.g. May 2025)
-            # Default to 1st of month
-            match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', time_str, re.IGNORECASE)
-            if match:
-                try:
-                    dt = datetime.strptime(match.group(0), '%B %Y')
-                    return int(dt.timestamp())
-                except ValueError:
-                    pass
-
-            # Standard formats
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y/%m/%d %H:%M:%S',
-                '%Y年%m月%d日 %H:%M:%S',
-                '%Y年%m月%d日',
-                '%Y-%m-%d',
-                '%Y/%m/%d',
-                '%B %d, %Y',  # January 1, 2024
-                '%b %d, %Y',  # Jan 1, 2024
-                '%d %B %Y',   # 1 January 2024
-                '%d %b %Y',   # 1 Jan 2024
-            ]
-            
-            for fmt in formats:
-                try:
-                    # 取前25个字符避免过多垃圾字符，但有些格式较长
-                    clean_time_str = time_str[:30].strip()
-                    dt = datetime.strptime(clean_time_str, fmt)
-                    return int(dt.timestamp())
-                except ValueError:
-                    continue
-            
-            # 宽松匹配：提取数字
-            # 例如 "Oct 12, 2024"
-            try:
-                from dateutil import parser
-                dt = parser.parse(time_str, fuzzy=True)
-                return int(dt.timestamp())
-            except:
-                pass
-
-            # logger.warning(f"Failed to parse timestamp: {time_str}")
-            return None
+            value, relative = _parse_timestamp_cached(time_str.strip())
+            if relative:
+                # 相对时间只缓存偏移量，基准时间每次取当前时间
+                return int(datetime.now().timestamp()) - value
+            return value
             
         except Exception as e:
             logger.error(f"Error parsing timestamp {time_str}: {e}")
@@ -341,26 +957,13 @@ class BaseWebScraper(ABC):
             try:
                 if not script.string:
                     continue
-                data = json.loads(script.string)
+                # orjson不接受str子类（NavigableString），需先转换为str
+                data = _json_loads(str(script.string))
                 if isinstance(data, list):
                     data = data[0]
                 
                 # 递归查找 datePublished
-                def find_date(obj):
-                    if isinstance(obj, dict):
-                        for k, v in obj.items():
-                            if k in ['datePublished', 'dateCreated', 'dateModified']:
-                                return v
-                            if isinstance(v, (dict, list)):
-                                res = find_date(v)
-                                if res: return res
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            res = find_date(item)
-                            if res: return res
-                    return None
-                
-                time_str = find_date(data)
+                time_str = _find_ld_date(data)
                 if time_str:
                     logger.debug(f"Found date in JSON-LD: {time_str}")
                     break
@@ -369,19 +972,7 @@ class BaseWebScraper(ABC):
         
         # 2. 尝试从meta标签提取
         if not time_str:
-            meta_props = [
-                'article:published_time', 
-                'og:updated_time', 
-                'date', 
-                'parsely-pub-date',
-                'publish_date'
-            ]
-            for prop in meta_props:
-                time_elem = soup.find('meta', attrs={'property': prop}) or \
-                           soup.find('meta', attrs={'name': prop})
-                if time_elem:
-                    time_str = time_elem.get('content', '')
-                    if time_str: break
+            time_str = _pick_meta_time(m.attrs for m in soup.find_all('meta'))
         
         # 3. 尝试从time标签提取
         if not time_str:
@@ -392,7 +983,7 @@ class BaseWebScraper(ABC):
             
             if not time_elem:
                 # 查找class包含date的元素中的time
-                date_container = soup.find(['div', 'span', 'p'], class_=lambda x: x and 'date' in str(x).lower())
+                date_container = soup.select_one(_DATE_CONTAINER_SELECTOR)
                 if date_container:
                     time_elem = date_container.find('time')
             
@@ -402,50 +993,20 @@ class BaseWebScraper(ABC):
             
             if time_elem:
                 # 优先使用 datetime 属性
-                dt_attr = time_elem.get('datetime', '')
-                text_content = time_elem.get_text().strip()
-                
-                # 如果datetime属性只包含年月（如May 2025），且文本包含更详细日期，优先用文本
-                if dt_attr and len(dt_attr) < 10 and len(text_content) > len(dt_attr):
-                     time_str = text_content
-                else:
-                    time_str = dt_attr or text_content
+                time_str = _pick_time_text(time_elem.get('datetime', ''), time_elem.get_text().strip())
         
         # 4. Try regex in text
         if not time_str:
-            # English Month Day, Year
-            date_pattern_en = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4}', re.IGNORECASE)
-            # Month Year (e.g. May 2025) - strict to avoid matching random text
-            date_pattern_my = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}', re.IGNORECASE)
-            
-            # Chinese Date
-            date_pattern_cn = re.compile(r'\d{4}年\d{1,2}月\d{1,2}日')
-            # ISO Date
-            date_pattern_iso = re.compile(r'\d{4}-\d{2}-\d{2}')
-
-            patterns = [date_pattern_en, date_pattern_cn, date_pattern_iso, date_pattern_my]
-            
             # Look in metadata area first
-            meta_area = soup.find(['header', 'div', 'span'], class_=lambda x: x and any(k in str(x).lower() for k in ['meta', 'info', 'date', 'author', 'time']))
+            meta_area = soup.select_one(_META_AREA_SELECTOR)
             if meta_area:
-                text = meta_area.get_text()
-                for pattern in patterns:
-                    match = pattern.search(text)
-                    if match:
-                        time_str = match.group(0)
-                        break
+                time_str = _search_date_text(meta_area.get_text())
             
             if not time_str:
                 # 在全文开头查找（前2000字符）
-                text = soup.get_text()[:2000]
-                for pattern in patterns:
-                    match = pattern.search(text)
-                    if match:
-                        time_str = match.group(0)
-                        break
+                time_str = _search_date_text(_leading_text(soup, 2000))
                         
         return time_str
-
     
     def extract_reference_links(self, soup: BeautifulSoup, content_elem: Optional[BeautifulSoup]) -> List[Dict]:
         """
@@ -463,30 +1024,61 @@ class BaseWebScraper(ABC):
         if not content_elem:
             return reference_links
         
-        candidates = []
+        # {href: 链接文本}，重复的href只保留第一次出现的文本
+        candidates: Dict[str, str] = {}
+        text_parts = []
+        # 与get_text()相同的文本节点类型（跳过注释、脚本等）
+        text_types = getattr(content_elem, 'interesting_string_types', (NavigableString, CData))
+        if isinstance(text_types, type):
+            text_types = (text_types,)
         
-        # 1. 提取<a>标签中的链接
-        for link in content_elem.find_all('a', href=True):
-            href = link.get('href', '').strip()
-            text = link.get_text(strip=True)
-            if href:
-                candidates.append((href, text or href))
+        # 一次遍历同时收集<a>标签和文本内容
+        for node in content_elem.descendants:
+            if isinstance(node, Tag):
+                # 1. 提取<a>标签中的链接
+                if node.name == 'a' and node.get('href') is not None:
+                    href = node.get('href', '').strip()
+                    if href and href not in candidates:
+                        candidates[href] = node.get_text(strip=True) or href
+            elif type(node) in text_types:
+                text_parts.append(node)
         
         # 2. 提取文本内容中的链接
-        text_content = content_elem.get_text()
-        url_pattern = re.compile(r'https?://[^\s<>\[\]"\'\u4e00-\u9fa5]+')
-        text_urls = url_pattern.findall(text_content)
+        for m in _URL_RE.finditer(''.join(text_parts)):
+            candidates.setdefault(m.group(0), m.group(0))
         
-        for url in text_urls:
-            url = url.rstrip('.,;:。，；：')
-            candidates.append((url, url))
+        return self._filter_reference_candidates(candidates)
+    
+    async def extract_reference_links_async(self, soup: BeautifulSoup, content_elem: Optional[BeautifulSoup]) -> List[Dict]:
+        """
+        在线程池中执行extract_reference_links，避免长文章的树遍历阻塞事件循环中的其他请求
         
-        # 去重和过滤
+        Args:
+            soup: BeautifulSoup对象
+            content_elem: 内容元素
+            
+        Returns:
+            参考链接列表
+        """
+        return await asyncio.to_thread(self.extract_reference_links, soup, content_elem)
+    
+    def _filter_reference_candidates(self, candidates: Dict[str, str]) -> List[Dict]:
+        """
+        对候选链接补全、去重、过滤并分类
+        
+        Args:
+            candidates: {href: text} 候选链接（已按原始href去重）
+            
+        Returns:
+            参考链接列表
+        """
         seen_urls = set()
         unique_links = []
+        base_domain = self._base_netloc
         
-        for href, text in candidates:
-            if not href:
+        for href, text in candidates.items():
+            # 站内链接（绝对或相对路径）直接跳过，无需补全和解析
+            if href.startswith(self.base_url) or (href[0] in '/#?' and not href.startswith('//')):
                 continue
             
             # 补全相对路径
@@ -497,9 +1089,7 @@ class BaseWebScraper(ABC):
                 continue
             
             # 过滤掉自身网站的链接
-            base_domain = urlparse(self.base_url).netloc
-            href_domain = urlparse(href).netloc
-            if base_domain in href_domain:
+            if base_domain in _url_netloc(href).lower():
                 continue
             
             # 识别参考来源
@@ -525,48 +1115,7 @@ class BaseWebScraper(ABC):
         Returns:
             链接类型，不符合条件返回None
         """
-        url_lower = url.lower()
-        
-        # 论文相关
-        if any(domain in url_lower for domain in [
-            'arxiv.org', 'paperswithcode.com', 'semanticscholar.org',
-            'acm.org', 'ieee.org', 'nature.com', 'science.org'
-        ]):
-            return 'paper'
-        
-        # GitHub/代码仓库
-        elif any(domain in url_lower for domain in [
-            'github.com', 'gitlab.com', 'huggingface.co'
-        ]):
-            return 'code'
-        
-        # AI公司官方网站
-        elif any(domain in url_lower for domain in [
-            'openai.com', 'anthropic.com', 'google.com', 'microsoft.com',
-            'meta.com', 'nvidia.com', 'apple.com', 'deepmind.com',
-            'baidu.com', 'alibaba.com'
-        ]):
-            return 'official'
-        
-        # 技术博客
-        elif any(domain in url_lower for domain in [
-            'blog.', 'medium.com', 'towardsdatascience.com', 'hackernoon.com'
-        ]):
-            return 'blog'
-        
-        # 社交媒体
-        elif any(domain in url_lower for domain in [
-            'twitter.com', 'x.com', 'zhihu.com', 'youtube.com', 'bilibili.com'
-        ]):
-            # 排除分享按钮
-            if not any(k in url_lower for k in ['share', 'intent/tweet', 'sharer']):
-                return 'social'
-        
-        # 其他外部链接
-        elif url.startswith('http'):
-            return 'external'
-        
-        return None
+        return _classify_url(url)
     
     def clean_text(self, text: str) -> str:
         """
@@ -580,9 +1129,24 @@ class BaseWebScraper(ABC):
         """
         if not text:
             return ''
-        # 移除多余的空白字符
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # 移除多余的空白字符（str.split()按任意空白切分，并去掉首尾空白）
+        return ' '.join(text.split())
+    
+    def element_text(self, elem: Tag) -> str:
+        """
+        获取元素清理后的文本（标题等只含单个文本节点的元素直接取该节点，省去get_text的递归收集）
+        
+        Args:
+            elem: BeautifulSoup元素
+            
+        Returns:
+            清理后的文本，与clean_text(elem.get_text())一致
+        """
+        text = elem.string
+        # 只有普通文本节点可以直接使用（注释、脚本等不计入get_text）
+        if type(text) is not NavigableString:
+            text = elem.get_text()
+        return self.clean_text(text)
     
     def parse_tags(self, tag_elements) -> str:
         """
@@ -594,9 +1158,17 @@ class BaseWebScraper(ABC):
         Returns:
             JSON格式的标签字符串
         """
-        tags = []
-        for tag_elem in tag_elements:
-            tag_text = tag_elem.get_text(strip=True)
-            if tag_text:
-                tags.append(tag_text)
-        return json.dumps(tags, ensure_ascii=False) if tags else ''
+        tags = [t for t in (e.get_text(strip=True) for e in tag_elements) if t]
+        return self.dump_json(tags)
+    
+    def dump_json(self, obj) -> str:
+        """
+        序列化为JSON字符串（见模块级dump_json）
+        
+        Args:
+            obj: 待序列化的对象
+            
+        Returns:
+            JSON字符串，obj为空时返回空字符串
+        """
+        return dump_json(obj)
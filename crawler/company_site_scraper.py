@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Company Site Scraper
+结构相同的公司官网（博客/新闻 + 研究）通用爬虫，各站点只需提供一份CompanySiteSpec
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from crawler.base_scraper import BaseWebScraper
+from crawler import utils
+
+logger = utils.setup_logger()
+
+# class包含content/article的正文容器元素
+_CONTENT_CLASS_RE = re.compile(r'content|article', re.I)
+# class包含author的作者元素
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+# class包含tag的标签元素
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+# class包含date的日期元素
+_DATE_CLASS_RE = re.compile(r'date', re.I)
+# 正文中的英文日期（如 "Mar 4, 2024"）
+_MONTH_DATE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}', re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class CompanySiteSpec:
+    """
+    公司官网站点描述
+    
+    Attributes:
+        base_url: 站点根URL
+        company_name: 公司名称，同时作为article_id前缀
+        display_name: 日志中的名称，也是页面没有作者信息时的默认作者
+        default_type: 非研究类文章的类型（如'blog'、'news'）
+        list_urls: (文章类型, 列表页URL) 列表，第一项为默认列表页
+        fallback_selector: 列表页找不到文章容器时使用的链接CSS选择器
+        product_keywords: 标题包含其中任一关键词（不区分大小写）时标记为产品文章
+        excluded_urls: 列表页中需要跳过的非文章链接（去掉末尾'/'后比较）
+        date_fallbacks: 通用逻辑找不到发布时间时，是否再从class包含date的元素和正文英文日期中查找
+        fallback_type: 链接既不在research也不在default_type路径下时的文章类型，默认使用请求的列表类型
+    """
+    base_url: str
+    company_name: str
+    display_name: str
+    default_type: str
+    list_urls: Tuple[Tuple[str, str], ...]
+    fallback_selector: str
+    product_keywords: Tuple[str, ...]
+    excluded_urls: Tuple[str, ...] = ()
+    date_fallbacks: bool = False
+    fallback_type: Optional[str] = None
+
+
+class CompanySiteScraper(BaseWebScraper):
+    """按CompanySiteSpec抓取公司官网的通用爬虫"""
+    
+    def __init__(self, spec: CompanySiteSpec, **kwargs):
+        kwargs.setdefault('requests_per_minute', 30)
+        kwargs.setdefault('rate_limit_burst', 1)
+        super().__init__(base_url=spec.base_url, company_name=spec.company_name, **kwargs)
+        self.spec = spec
+        # 产品关键词编译为一个正则，一次扫描标题匹配全部关键词
+        self._product_re = re.compile('|'.join(map(re.escape, spec.product_keywords)), re.I) if spec.product_keywords else None
+    
+    async def get_article_list(self, page: int = 1, article_type: Optional[str] = None) -> List[Dict]:
+        """获取文章列表"""
+        spec = self.spec
+        article_type = article_type or spec.default_type
+        try:
+            list_urls = dict(spec.list_urls)
+            url = list_urls.get(article_type) or spec.list_urls[0][1]
+            
+            logger.info(f"Fetching {spec.display_name} {article_type} list from {url}...")
+            
+            html = await self.fetch_page(url)
+            if not html:
+                return []
+            
+            articles = []
+            # 同一篇文章可能被多个嵌套容器匹配到，去重后避免重复抓取详情
+            seen_article_ids = set()
+            
+            list_items = self.extract_list_items(html, ('post', 'card', 'item', 'article'), spec.fallback_selector)
+            
+            default_path = f"/{spec.default_type}/"
+            for url, title in list_items:
+                try:
+                    if not url:
+                        continue
+                    
+                    # 过滤掉非文章页面
+                    if url.rstrip('/') in spec.excluded_urls:
+                        continue
+                    
+                    url = self.resolve_list_url(url)
+                    if not url:
+                        continue
+                    
+                    article_id = self.extract_article_id(url)
+                    if not article_id:
+                        continue
+                    
+                    if not title or len(title) < 5:
+                        continue
+                    
+                    if '/research/' in url:
+                        determined_type = 'research'
+                    elif default_path in url:
+                        determined_type = spec.default_type
+                    else:
+                        determined_type = spec.fallback_type or article_type
+                    
+                    if article_id in seen_article_ids:
+                        continue
+                    seen_article_ids.add(article_id)
+                    
+                    articles.append({
+                        'article_id': f"{spec.company_name}_{article_id}",
+                        'title': title[:500],
+                        'url': url,
+                        'article_type': determined_type,
+                    })
+                
+                except Exception as e:
+                    logger.warning(f"Failed to parse article element: {e}")
+                    continue
+            
+            logger.info(f"Extracted {len(articles)} {spec.display_name} articles")
+            return articles
+        
+        except Exception as e:
+            logger.error(f"Failed to get {spec.display_name} article list: {e}")
+            return []
+    
+    async def get_article_detail(self, article_id: str, url: str) -> Optional[Dict]:
+        """获取文章详情"""
+        spec = self.spec
+        try:
+            logger.info(f"Fetching {spec.display_name} article details: {article_id}")
+            
+            html = await self.fetch_page(url)
+            if not html:
+                return None
+            
+            soup = self.make_soup(html)
+            # 标题、正文、描述等元素一次遍历取出
+            page = self.collect_page_elements(soup)
+            
+            article = {
+                'article_id': article_id,
+                'article_url': url,
+                'company': self.company_name,
+            }
+            
+            # 标题
+            title_elem = page.get('h1') or page.get('title')
+            article['title'] = self.element_text(title_elem) if title_elem else ''
+            
+            # 内容
+            content_elem = page.get('article') or page.get('main')
+            if not content_elem:
+                content_elem = soup.find(['div'], class_=_CONTENT_CLASS_RE)
+            
+            article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
+            
+            # 提取参考链接
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
+            
+            # 描述
+            desc_elem = page.get('description') or page.get('og:description')
+            if desc_elem:
+                article['description'] = desc_elem.get('content', '')
+            else:
+                article['description'] = article['content'][:300]
+            
+            # 作者
+            author_elem = soup.find(['span', 'div', 'p'], class_=_AUTHOR_CLASS_RE)
+            if not author_elem:
+                author_elem = page.get('author')
+                article['author'] = author_elem.get('content', '') if author_elem else spec.display_name
+            else:
+                article['author'] = self.clean_text(author_elem.get_text())
+            
+            # 发布时间 (使用 BaseWebScraper 增强版逻辑)
+            time_str = self.find_publish_time_string(soup, content_elem)
+            
+            if not time_str and spec.date_fallbacks:
+                # 部分站点把日期放在特定的class中，如 "PostHeader_date__..."
+                date_elem = soup.find(class_=_DATE_CLASS_RE)
+                if date_elem:
+                    time_str = date_elem.get_text()
+                
+                if not time_str:
+                    # 尝试查找包含年份的文本
+                    match = _MONTH_DATE_RE.search(soup.get_text())
+                    if match:
+                        time_str = match.group(0)
+            
+            if not time_str:
+                logger.warning(f"Skip article {article_id}: missing publish time.")
+                return None
+            
+            publish_ts = self.parse_timestamp(time_str)
+            if publish_ts is None:
+                logger.warning(f"Skip article {article_id}: cannot parse publish time: {time_str}")
+                return None
+            article['publish_time'] = publish_ts
+            article['publish_date'] = utils.format_date(publish_ts)
+            
+            # 分类与文章类型
+            is_research = '/research/' in url
+            article['category'] = 'AI Research' if is_research else f"AI {spec.default_type.title()}"
+            
+            # 标签
+            tag_elements = soup.find_all(['a', 'span'], class_=_TAG_CLASS_RE)
+            tags = []
+            for tag_elem in tag_elements:
+                tag_text = self.clean_text(tag_elem.get_text())
+                if tag_text and len(tag_text) < 50:
+                    tags.append(tag_text)
+            article['tags'] = self.dump_json(tags)
+            
+            # 封面图片
+            img_elem = page.get('og:image')
+            if img_elem:
+                article['cover_image'] = img_elem.get('content', '')
+            else:
+                img_elem = page.get('img')
+                article['cover_image'] = img_elem.get('src', '') if img_elem else ''
+            
+            article['article_type'] = 'research' if is_research else spec.default_type
+            article['is_research'] = 1 if is_research else 0
+            article['is_product'] = 1 if self._product_re and self._product_re.search(article['title']) else 0
+            
+            return article
+        
+        except Exception as e:
+            logger.error(f"Failed to get {spec.display_name} article details {article_id}: {e}")
+            return None
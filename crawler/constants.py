@@ -5,7 +5,9 @@ Crawler Constants
 爬虫配置常量
 """
 
-from typing import Dict, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Tuple
 
 # 爬虫默认配置
 DEFAULT_CRAWLER_CONFIG = {
@@ -25,131 +27,147 @@ SCHEDULER_CONFIG = {
     'incremental_threshold': 3600,  # 增量更新阈值（秒，1小时）
 }
 
-# 数据库表映射
-DB_TABLE_MAP = {
+# 数据库表映射（只读）
+DB_TABLE_MAP = MappingProxyType({
     'company': 'company_article',  # 公司文章表
     'news': 'qbitai_article',  # 新闻文章表
     'tools': 'qbitai_article',  # AI工具文章表
     'aibase': 'aibase_article',  # AIbase文章表
     'baai_hub': 'baai_hub_article',  # BAAI Hub文章表
-}
+})
+
+
+@dataclass(frozen=True, slots=True)
+class CrawlerConfig:
+    """爬虫注册配置"""
+    key: str  # 爬虫唯一标识
+    name: str  # 显示名称
+    module: str  # 模块路径（用于动态导入）
+    class_name: str  # 爬虫类名
+    runner: Optional[str]  # runner函数名
+    type: str = 'company'  # 爬虫类型（company/news/tools）
+    enabled: bool = True
+    priority: int = 5  # 1-10，数字越小优先级越高
+    description: str = ''
+    db_table: str = 'company_article'
+
 
 # 爬虫配置信息（用于注册）
-CRAWLER_CONFIGS: List[Dict] = [
+CRAWLER_CONFIGS: Tuple[CrawlerConfig, ...] = (
     # AI公司爬虫
-    {
-        'key': 'anthropic',
-        'name': 'Anthropic',
-        'module': 'crawler.anthropic_scraper',
-        'class': 'AnthropicScraper',
-        'runner': 'run_anthropic_crawler',
-        'type': 'company',
-        'enabled': True,
-        'priority': 1,
-        'description': 'Anthropic官方新闻和研究',
-        'db_table': 'company_article',
-    },
-    {
-        'key': 'google_deepmind',
-        'name': 'Google DeepMind',
-        'module': 'crawler.google_ai_scraper',
-        'class': 'GoogleAIScraper',
-        'runner': 'run_google_ai_crawler',
-        'type': 'company',
-        'enabled': True,
-        'priority': 1,
-        'description': 'Google DeepMind官方博客',
-        'db_table': 'company_article',
-    },
-    {
-        'key': 'meta',
-        'name': 'Meta AI',
-        'module': 'crawler.meta_microsoft_scraper',
-        'class': 'MetaAIScraper',
-        'runner': 'run_meta_microsoft_crawler',
-        'type': 'company',
-        'enabled': True,
-        'priority': 1,
-        'description': 'Meta AI研究论文和博客',
-        'db_table': 'company_article',
-    },
-    {
-        'key': 'nvidia',
-        'name': 'NVIDIA',
-        'module': 'crawler.ai_companies_scraper',
-        'class': 'NVIDIAScraper',
-        'runner': 'run_nvidia_crawler',
-        'type': 'company',
-        'enabled': True,
-        'priority': 2,
-        'description': 'NVIDIA AI新闻',
-        'db_table': 'company_article',
-    },
-    {
-        'key': 'openai',
-        'name': 'OpenAI',
-        'module': 'crawler.openai_scraper',
-        'class': 'OpenAIScraper',
-        'runner': 'run_openai_crawler',
-        'type': 'company',
-        'enabled': True,
-        'priority': 1,
-        'description': 'OpenAI官方新闻',
-        'db_table': 'company_article',
-    },
+    CrawlerConfig(
+        key='anthropic',
+        name='Anthropic',
+        module='crawler.anthropic_scraper',
+        class_name='AnthropicScraper',
+        runner='run_anthropic_crawler',
+        type='company',
+        enabled=True,
+        priority=1,
+        description='Anthropic官方新闻和研究',
+        db_table='company_article',
+    ),
+    CrawlerConfig(
+        key='google_deepmind',
+        name='Google DeepMind',
+        module='crawler.google_ai_scraper',
+        class_name='GoogleAIScraper',
+        runner='run_google_ai_crawler',
+        type='company',
+        enabled=True,
+        priority=1,
+        description='Google DeepMind官方博客',
+        db_table='company_article',
+    ),
+    CrawlerConfig(
+        key='meta',
+        name='Meta AI',
+        module='crawler.meta_microsoft_scraper',
+        class_name='MetaAIScraper',
+        runner='run_meta_microsoft_crawler',
+        type='company',
+        enabled=True,
+        priority=1,
+        description='Meta AI研究论文和博客',
+        db_table='company_article',
+    ),
+    CrawlerConfig(
+        key='nvidia',
+        name='NVIDIA',
+        module='crawler.ai_companies_scraper',
+        class_name='NVIDIAScraper',
+        runner='run_nvidia_crawler',
+        type='company',
+        enabled=True,
+        priority=2,
+        description='NVIDIA AI新闻',
+        db_table='company_article',
+    ),
+    CrawlerConfig(
+        key='openai',
+        name='OpenAI',
+        module='crawler.openai_scraper',
+        class_name='OpenAIScraper',
+        runner='run_openai_crawler',
+        type='company',
+        enabled=True,
+        priority=1,
+        description='OpenAI官方新闻',
+        db_table='company_article',
+    ),
     
     # 新闻媒体爬虫
-    {
-        'key': 'aibase',
-        'name': 'AIbase',
-        'module': 'crawler.aibase_scraper',
-        'class': 'AibaseWebScraper',
-        'runner': 'run_crawler',
-        'type': 'news',
-        'enabled': True,
-        'priority': 1,
-        'description': 'AIbase AI Daily News',
-        'db_table': 'aibase_article',
-    },
-    {
-        'key': 'baai_hub',
-        'name': 'BAAI Hub',
-        'module': 'crawler.baai_hub_scraper',
-        'class': 'BaaiHubScraper',
-        'runner': 'run_crawler',
-        'type': 'news',
-        'enabled': True,
-        'priority': 1,
-        'description': 'Beijing Academy of Artificial Intelligence Hub',
-        'db_table': 'baai_hub_article',
-    },
-    {
-        'key': 'qbitai',
-        'name': '量子位',
-        'module': 'crawler.qbitai_scraper',
-        'class': 'QbitaiWebScraper',
-        'runner': 'run_crawler',
-        'type': 'news',
-        'enabled': True,
-        'priority': 1,
-        'description': '国内主要AI科技新闻媒体',
-        'db_table': 'qbitai_article',
-    },
+    CrawlerConfig(
+        key='aibase',
+        name='AIbase',
+        module='crawler.aibase_scraper',
+        class_name='AibaseWebScraper',
+        runner='run_crawler',
+        type='news',
+        enabled=True,
+        priority=1,
+        description='AIbase AI Daily News',
+        db_table='aibase_article',
+    ),
+    CrawlerConfig(
+        key='baai_hub',
+        name='BAAI Hub',
+        module='crawler.baai_hub_scraper',
+        class_name='BaaiHubScraper',
+        runner='run_crawler',
+        type='news',
+        enabled=True,
+        priority=1,
+        description='Beijing Academy of Artificial Intelligence Hub',
+        db_table='baai_hub_article',
+    ),
+    CrawlerConfig(
+        key='qbitai',
+        name='量子位',
+        module='crawler.qbitai_scraper',
+        class_name='QbitaiWebScraper',
+        runner='run_crawler',
+        type='news',
+        enabled=True,
+        priority=1,
+        description='国内主要AI科技新闻媒体',
+        db_table='qbitai_article',
+    ),
     
     # AI工具爬虫（示例配置，可扩展）
-    {
-        'key': 'ai_tools',
-        'name': 'AI Tools',
-        'module': 'crawler.ai_tools_scraper',
-        'class': 'AIToolsScraper',
-        'runner': None,
-        'type': 'tools',
-        'enabled': False,  # 默认禁用
-        'priority': 3,
-        'description': 'AI工具博客聚合',
-        'db_table': 'qbitai_article',
-    },
-]
+    CrawlerConfig(
+        key='ai_tools',
+        name='AI Tools',
+        module='crawler.ai_tools_scraper',
+        class_name='AIToolsScraper',
+        runner=None,
+        type='tools',
+        enabled=False,  # 默认禁用
+        priority=3,
+        description='AI工具博客聚合',
+        db_table='qbitai_article',
+    ),
+)
 
 # HTTP请求头
 DEFAULT_HEADERS = {
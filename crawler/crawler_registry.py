@@ -6,6 +6,7 @@
 """
 
 import importlib
+import threading
 from typing import Dict, List, Type, Optional, Callable, Any
 from enum import Enum
 
@@ -27,6 +28,8 @@ class CrawlerRegistry:
     
     def __init__(self):
         self._crawlers: Dict[str, Dict] = {}
+        # 排序后的爬虫列表缓存：{(爬虫类型或None, enabled_only): 列表}，注册新爬虫时清空
+        self._sorted_cache: Dict[tuple, List[Dict]] = {}
     
     def register(
         self, 
@@ -70,29 +73,37 @@ class CrawlerRegistry:
             'module_path': module_path,
             'class_name': class_name,
             'runner_name': runner_name,
+            'runner': None,
         }
+        self._sorted_cache.clear()
         logger.debug(f"Registered crawler: {name} ({key})")
     
     def get_crawler(self, key: str) -> Optional[Dict]:
         """获取指定的爬虫配置"""
         return self._crawlers.get(key)
     
+    def _get_sorted_crawlers(self, crawler_type: Optional[CrawlerType], enabled_only: bool) -> List[Dict]:
+        """按优先级排序的爬虫列表（按类型和启用状态缓存，返回副本，调用方可自由修改）"""
+        cache_key = (crawler_type, enabled_only)
+        crawlers = self._sorted_cache.get(cache_key)
+        if crawlers is None:
+            crawlers = list(self._crawlers.values())
+            if crawler_type is not None:
+                crawlers = [c for c in crawlers if c.get('type') == crawler_type]
+            if enabled_only:
+                crawlers = [c for c in crawlers if c.get('enabled', True)]
+            # 按优先级排序
+            crawlers.sort(key=lambda x: x.get('priority', 999))
+            self._sorted_cache[cache_key] = crawlers
+        return list(crawlers)
+    
     def get_all_crawlers(self, enabled_only: bool = True) -> List[Dict]:
         """获取所有爬虫"""
-        crawlers = list(self._crawlers.values())
-        if enabled_only:
-            crawlers = [c for c in crawlers if c.get('enabled', True)]
-        # 按优先级排序
-        crawlers.sort(key=lambda x: x.get('priority', 999))
-        return crawlers
+        return self._get_sorted_crawlers(None, enabled_only)
     
     def get_crawlers_by_type(self, crawler_type: CrawlerType, enabled_only: bool = True) -> List[Dict]:
         """根据类型获取爬虫"""
-        crawlers = [c for c in self._crawlers.values() if c.get('type') == crawler_type]
-        if enabled_only:
-            crawlers = [c for c in crawlers if c.get('enabled', True)]
-        crawlers.sort(key=lambda x: x.get('priority', 999))
-        return crawlers
+        return self._get_sorted_crawlers(crawler_type, enabled_only)
     
     def get_crawler_class(self, key: str) -> Optional[Type]:
         """获取爬虫类（动态导入）"""
@@ -130,6 +141,10 @@ class CrawlerRegistry:
             logger.error(f"Crawler {key} not found")
             return None
         
+        # 如果已经导入过runner，直接返回
+        if crawler_info.get('runner'):
+            return crawler_info['runner']
+        
         runner_name = crawler_info.get('runner_name')
         if not runner_name:
             logger.warning(f"Crawler {key} has no runner function")
@@ -143,6 +158,8 @@ class CrawlerRegistry:
         try:
             module = importlib.import_module(module_path)
             runner_func = getattr(module, runner_name)
+            # 缓存runner函数
+            crawler_info['runner'] = runner_func
             return runner_func
         except Exception as e:
             logger.error(f"Failed to import runner {runner_name} from {module_path}: {e}")
@@ -171,14 +188,19 @@ class CrawlerRegistry:
 
 # 全局爬虫注册中心实例
 _global_registry = None
+_global_registry_lock = threading.Lock()
 
 
 def get_global_registry() -> CrawlerRegistry:
-    """获取全局爬虫注册中心实例"""
+    """获取全局爬虫注册中心实例（多线程同时首次调用时也只初始化一次）"""
     global _global_registry
     if _global_registry is None:
-        _global_registry = CrawlerRegistry()
-        _register_all_crawlers(_global_registry)
+        with _global_registry_lock:
+            if _global_registry is None:
+                # 注册完成后再发布，其他线程不会看到未注册完的实例
+                registry = CrawlerRegistry()
+                _register_all_crawlers(registry)
+                _global_registry = registry
     return _global_registry
 
 
@@ -186,21 +208,17 @@ def _register_all_crawlers(registry: CrawlerRegistry):
     """从配置自动注册所有爬虫"""
     try:
         for config in CRAWLER_CONFIGS:
-            # 转换type字符串为枚举
-            crawler_type_str = config.get('type', 'company')
-            crawler_type = CrawlerType(crawler_type_str)
-            
             registry.register(
-                key=config['key'],
-                name=config['name'],
-                crawler_type=crawler_type,
-                enabled=config.get('enabled', True),
-                priority=config.get('priority', 5),
-                description=config.get('description', ''),
-                db_table=config.get('db_table', 'company_article'),
-                module_path=config.get('module'),
-                class_name=config.get('class'),
-                runner_name=config.get('runner'),
+                key=config.key,
+                name=config.name,
+                crawler_type=CrawlerType(config.type),
+                enabled=config.enabled,
+                priority=config.priority,
+                description=config.description,
+                db_table=config.db_table,
+                module_path=config.module,
+                class_name=config.class_name,
+                runner_name=config.runner,
             )
         
         logger.info(f"✅ 成功注册 {len(registry.get_all_crawlers(enabled_only=False))} 个爬虫")
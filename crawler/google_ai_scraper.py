@@ -8,17 +8,33 @@ Google AI (DeepMind & Google Research) Scraper
 import asyncio
 import json
 import re
-from datetime import datetime
 from typing import Dict, List, Optional
 
-from bs4 import BeautifulSoup
-
 from crawler.base_scraper import BaseWebScraper
-from crawler.openai_scraper import save_company_article_to_db
+from crawler.openai_scraper import process_company_articles
 from crawler import utils
 
 logger = utils.setup_logger()
 
+# class包含content/article的正文容器元素
+_CONTENT_CLASS_RE = re.compile(r'content|article', re.I)
+# class包含author的作者元素
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+# class包含tag的标签元素
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+# class包含date的日期元素
+_DATE_CLASS_RE = re.compile(r'date', re.I)
+# class包含meta/info/date/author的元数据区域元素
+_META_CLASS_RE = re.compile(r'meta|info|date|author', re.I)
+# 标题包含任一关键词时标记为产品文章（一次扫描匹配全部关键词）
+_PRODUCT_KEYWORD_RE = re.compile(r'gemini|bard|palm|product|launch|release|announce', re.I)
+# 列表页找不到文章容器时使用的文章链接选择器
+_ARTICLE_LINK_SELECTOR = 'a[href*="/blog/"], a[href*="/research/"], a[href*="/discover/"]'
+# 英文日期，如 "May 21, 2025"
+_MONTH_DAY_YEAR_RE = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}', re.IGNORECASE)
+# 英文日期，如 "21 May 2025"（DeepMind格式）
+_DAY_MONTH_YEAR_RE = re.compile(r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}', re.IGNORECASE)
+
 
 class GoogleAIScraper(BaseWebScraper):
     """Google AI官网爬虫（包括DeepMind）"""
@@ -35,7 +51,7 @@ class GoogleAIScraper(BaseWebScraper):
             base_url = "https://blog.google"
             company_name = "google"
         
-        super().__init__(base_url=base_url, company_name=company_name)
+        super().__init__(base_url=base_url, company_name=company_name, requests_per_minute=30, rate_limit_burst=1)
         self.source = source
         
         if source == 'deepmind':
@@ -61,45 +77,26 @@ class GoogleAIScraper(BaseWebScraper):
             if not html:
                 return []
             
-            soup = BeautifulSoup(html, 'html.parser')
             articles = []
+            # 同一篇文章可能被多个嵌套容器匹配到，去重后避免重复抓取详情
+            seen_article_ids = set()
             
             # Google和DeepMind都使用article标签或特定的卡片容器
-            article_elements = soup.find_all(['article', 'div'], class_=lambda x: x and any(keyword in str(x).lower() for keyword in ['post', 'card', 'item', 'article']))
-            
-            if not article_elements:
-                article_elements = soup.select('a[href*="/blog/"], a[href*="/research/"], a[href*="/discover/"]')
+            list_items = self.extract_list_items(html, ('post', 'card', 'item', 'article'), _ARTICLE_LINK_SELECTOR)
             
-            logger.info(f"Found {len(article_elements)} potential article elements")
-            
-            for elem in article_elements[:30]:
+            for url, title in list_items:
                 try:
-                    if elem.name == 'a':
-                        link_elem = elem
-                    else:
-                        link_elem = elem.find('a', href=True)
-                    
-                    if not link_elem:
-                        continue
-                    
-                    url = link_elem.get('href', '')
                     if not url:
                         continue
                     
-                    if url.startswith('/'):
-                        url = self.base_url + url
-                    elif not url.startswith('http'):
+                    url = self.resolve_list_url(url)
+                    if not url:
                         continue
                     
                     article_id = self.extract_article_id(url)
                     if not article_id:
                         continue
                     
-                    title_elem = elem.find(['h1', 'h2', 'h3', 'h4'])
-                    if not title_elem:
-                        title_elem = link_elem
-                    title = self.clean_text(title_elem.get_text())
-                    
                     if not title or len(title) < 5:
                         continue
                     
@@ -108,6 +105,10 @@ class GoogleAIScraper(BaseWebScraper):
                     else:
                         determined_type = 'blog'
                     
+                    if article_id in seen_article_ids:
+                        continue
+                    seen_article_ids.add(article_id)
+                    
                     articles.append({
                         'article_id': f"{self.company_name}_{article_id}",
                         'title': title[:500],
@@ -135,7 +136,9 @@ class GoogleAIScraper(BaseWebScraper):
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
+            # 标题、正文、描述等元素一次遍历取出
+            page = self.collect_page_elements(soup)
             
             article = {
                 'article_id': article_id,
@@ -144,37 +147,31 @@ class GoogleAIScraper(BaseWebScraper):
             }
             
             # 标题
-            title_elem = soup.find('h1')
-            if not title_elem:
-                title_elem = soup.find('title')
-            article['title'] = self.clean_text(title_elem.get_text()) if title_elem else ''
+            title_elem = page.get('h1') or page.get('title')
+            article['title'] = self.element_text(title_elem) if title_elem else ''
             
             # 内容
-            content_elem = soup.find('article')
+            content_elem = page.get('article') or page.get('main')
             if not content_elem:
-                content_elem = soup.find('main')
-            if not content_elem:
-                content_elem = soup.find(['div'], class_=lambda x: x and ('content' in str(x).lower() or 'article' in str(x).lower()))
+                content_elem = soup.find(['div'], class_=_CONTENT_CLASS_RE)
             
             article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
             
             # 提取参考链接
-            reference_links = self.extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
             
             # 描述
-            desc_elem = soup.find('meta', attrs={'name': 'description'})
-            if not desc_elem:
-                desc_elem = soup.find('meta', attrs={'property': 'og:description'})
+            desc_elem = page.get('description') or page.get('og:description')
             if desc_elem:
                 article['description'] = desc_elem.get('content', '')
             else:
                 article['description'] = article['content'][:300]
             
             # 作者
-            author_elem = soup.find(['span', 'div', 'p'], class_=lambda x: x and 'author' in str(x).lower())
+            author_elem = soup.find(['span', 'div', 'p'], class_=_AUTHOR_CLASS_RE)
             if not author_elem:
-                author_elem = soup.find('meta', attrs={'name': 'author'})
+                author_elem = page.get('author')
                 article['author'] = author_elem.get('content', '') if author_elem else ('DeepMind' if self.source == 'deepmind' else 'Google AI')
             else:
                 article['author'] = self.clean_text(author_elem.get_text())
@@ -202,7 +199,7 @@ class GoogleAIScraper(BaseWebScraper):
             
             # 2. 尝试从meta标签提取
             if not time_str:
-                time_elem = soup.find('meta', attrs={'property': 'article:published_time'})
+                time_elem = page.get('article:published_time')
                 if time_elem:
                     time_str = time_elem.get('content', '')
             
@@ -215,7 +212,7 @@ class GoogleAIScraper(BaseWebScraper):
                 
                 if not time_elem:
                     # 查找class包含date的元素中的time
-                    date_container = soup.find(['div', 'span', 'p'], class_=lambda x: x and 'date' in str(x).lower())
+                    date_container = soup.find(['div', 'span', 'p'], class_=_DATE_CLASS_RE)
                     if date_container:
                         time_elem = date_container.find('time')
                 
@@ -236,32 +233,26 @@ class GoogleAIScraper(BaseWebScraper):
             
             # 4. 尝试从页面文本中提取日期模式
             if not time_str:
-                # 查找包含日期的文本元素
-                # Format: May 21, 2025
-                date_pattern = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}', re.IGNORECASE)
-                # Format: 21 May 2025 (DeepMind style)
-                date_pattern_2 = re.compile(r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}', re.IGNORECASE)
-                
                 # 在标题附近或metadata区域查找
-                meta_area = soup.find(['header', 'div'], class_=lambda x: x and any(k in str(x).lower() for k in ['meta', 'info', 'date', 'author']))
+                meta_area = soup.find(['header', 'div'], class_=_META_CLASS_RE)
                 if meta_area:
                     text = meta_area.get_text()
-                    match = date_pattern.search(text)
+                    match = _MONTH_DAY_YEAR_RE.search(text)
                     if match:
                         time_str = match.group(0)
                     else:
-                        match = date_pattern_2.search(text)
+                        match = _DAY_MONTH_YEAR_RE.search(text)
                         if match:
                             time_str = match.group(0)
                 
                 if not time_str:
                     # 在全文开头查找（前2000字符）
                     text_start = soup.get_text()[:2000]
-                    match = date_pattern.search(text_start)
+                    match = _MONTH_DAY_YEAR_RE.search(text_start)
                     if match:
                         time_str = match.group(0)
                     else:
-                        match = date_pattern_2.search(text_start)
+                        match = _DAY_MONTH_YEAR_RE.search(text_start)
                         if match:
                             time_str = match.group(0)
             
@@ -275,32 +266,33 @@ class GoogleAIScraper(BaseWebScraper):
                 return None
             
             article['publish_time'] = publish_ts
-            article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+            article['publish_date'] = utils.format_date(publish_ts)
             
-            # 分类
-            article['category'] = 'AI Research' if '/research/' in url else 'AI Blog'
+            # 分类与文章类型（与列表页相同，按URL判断）
+            is_research = '/research/' in url
+            article['category'] = 'AI Research' if is_research else 'AI Blog'
             
             # 标签
-            tag_elements = soup.find_all(['a', 'span'], class_=lambda x: x and 'tag' in str(x).lower())
+            tag_elements = soup.find_all(['a', 'span'], class_=_TAG_CLASS_RE)
             tags = []
             for tag_elem in tag_elements:
                 tag_text = self.clean_text(tag_elem.get_text())
                 if tag_text and len(tag_text) < 50:
                     tags.append(tag_text)
-            article['tags'] = json.dumps(tags, ensure_ascii=False) if tags else ''
+            article['tags'] = self.dump_json(tags)
             
             # 封面图片
-            img_elem = soup.find('meta', attrs={'property': 'og:image'})
+            img_elem = page.get('og:image')
             if img_elem:
                 article['cover_image'] = img_elem.get('content', '')
             else:
-                img_elem = soup.find('img')
+                img_elem = page.get('img')
                 article['cover_image'] = img_elem.get('src', '') if img_elem else ''
             
             # 文章类型判断
-            article['article_type'] = 'research' if '/research/' in url else 'blog'
-            article['is_research'] = 1 if article['article_type'] == 'research' else 0
-            article['is_product'] = 1 if any(keyword in article['title'].lower() for keyword in ['gemini', 'bard', 'palm', 'product', 'launch', 'release', 'announce']) else 0
+            article['article_type'] = 'research' if is_research else 'blog'
+            article['is_research'] = 1 if is_research else 0
+            article['is_product'] = 1 if _PRODUCT_KEYWORD_RE.search(article['title']) else 0
             
             return article
         
@@ -309,130 +301,49 @@ class GoogleAIScraper(BaseWebScraper):
             return None
 
 
+async def _run_google_ai_source(source: str, label: str, article_types: List[str], days: int):
+    """
+    抓取单个来源（Google AI或DeepMind）的文章
+    
+    Args:
+        source: GoogleAIScraper的source参数
+        label: 日志中使用的来源名称
+        article_types: 依次抓取的文章类型
+        days: 只保存最近days天内的文章
+    """
+    scraper = GoogleAIScraper(source=source)
+    await scraper.init()
+    
+    try:
+        for article_type in article_types:
+            logger.info(f"Fetching {label} {article_type} articles...")
+            articles = await scraper.get_article_list(article_type=article_type)
+            
+            count = await process_company_articles(scraper, articles[:15], days, f"{label} {article_type}")
+            logger.info(f"Saved {count} {label} {article_type} articles")
+    
+    finally:
+        await scraper.close()
+
+
 async def run_google_ai_crawler(days: int = 7):
     """运行Google AI爬虫"""
     logger.info("=" * 60)
     logger.info(f"🚀 Google AI Crawler Started (Filter: last {days} days)")
     logger.info("=" * 60)
     
-    # Google AI Blog
-    google_scraper = GoogleAIScraper(source='google')
-    await google_scraper.init()
-    
-    try:
-        logger.info("Fetching Google AI blog articles...")
-        articles = await google_scraper.get_article_list(article_type='blog')
-        
-        count = 0
-        for article_item in articles[:15]:
-            try:
-                article = await google_scraper.get_article_detail(
-                    article_item['article_id'],
-                    article_item['url']
-                )
-                
-                if article:
-                    # 检查日期
-                    if days > 0:
-                        article_ts = article['publish_time']
-                        now_ts = datetime.now().timestamp()
-                        # 如果文章时间在未来（允许1天误差），或者是最近days天内的
-                        if article_ts > now_ts + 86400:
-                             logger.warning(f"Skip article {article['title']}: future date ({article['publish_date']})")
-                             continue
-                        if now_ts - article_ts > days * 86400:
-                             logger.info(f"Skip article {article['title']}: too old ({article['publish_date']})")
-                             continue
-                    
-                    await save_company_article_to_db(article)
-                    count += 1
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing Google AI article: {e}")
-                continue
-        logger.info(f"Saved {count} Google AI articles")
-                
-    finally:
-        await google_scraper.close()
-    
-    # DeepMind
-    deepmind_scraper = GoogleAIScraper(source='deepmind')
-    await deepmind_scraper.init()
+    # Google AI Blog与DeepMind是不同站点，互不共享限流，并行抓取
+    results = await asyncio.gather(
+        _run_google_ai_source('google', 'Google AI', ['blog'], days),
+        _run_google_ai_source('deepmind', 'DeepMind', ['blog', 'research'], days),
+        return_exceptions=True,
+    )
+    logger.info("Google AI & DeepMind Crawler finished.")
     
-    try:
-        # DeepMind Blog
-        logger.info("Fetching DeepMind blog articles...")
-        blog_articles = await deepmind_scraper.get_article_list(article_type='blog')
-        
-        count = 0
-        for article_item in blog_articles[:15]:
-            try:
-                article = await deepmind_scraper.get_article_detail(
-                    article_item['article_id'],
-                    article_item['url']
-                )
-                
-                if article:
-                    # 检查日期
-                    if days > 0:
-                        article_ts = article['publish_time']
-                        now_ts = datetime.now().timestamp()
-                        if article_ts > now_ts + 86400:
-                             logger.warning(f"Skip article {article['title']}: future date ({article['publish_date']})")
-                             continue
-                        if now_ts - article_ts > days * 86400:
-                             logger.info(f"Skip article {article['title']}: too old ({article['publish_date']})")
-                             continue
-                    
-                    await save_company_article_to_db(article)
-                    count += 1
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing DeepMind blog article: {e}")
-                continue
-        logger.info(f"Saved {count} DeepMind blog articles")
-        
-        # DeepMind Research
-        logger.info("Fetching DeepMind research articles...")
-        research_articles = await deepmind_scraper.get_article_list(article_type='research')
-        
-        count = 0
-        for article_item in research_articles[:15]:
-            try:
-                article = await deepmind_scraper.get_article_detail(
-                    article_item['article_id'],
-                    article_item['url']
-                )
-                
-                if article:
-                    # 检查日期
-                    if days > 0:
-                        article_ts = article['publish_time']
-                        now_ts = datetime.now().timestamp()
-                        if article_ts > now_ts + 86400:
-                             logger.warning(f"Skip article {article['title']}: future date ({article['publish_date']})")
-                             continue
-                        if now_ts - article_ts > days * 86400:
-                             logger.info(f"Skip article {article['title']}: too old ({article['publish_date']})")
-                             continue
-                    
-                    await save_company_article_to_db(article)
-                    count += 1
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing DeepMind research article: {e}")
-                continue
-        logger.info(f"Saved {count} DeepMind research articles")
-        
-    finally:
-        await deepmind_scraper.close()
-        logger.info("Google AI & DeepMind Crawler finished.")
+    # 一个来源失败不影响另一个来源，但仍向调用方（调度器）报告失败
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP Client Pool
+进程级共享的HTTP客户端池，同一代理/配置的爬虫复用连接池
+"""
+
+import importlib.util
+from typing import Dict
+
+import httpx
+
+# httpx的HTTP/2支持依赖h2（httpx[http2]），只检查是否可用，不导入
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# 进程级共享的HTTP客户端，按 (代理, http2, 超时, 连接池限制) 复用连接池
+_GLOBAL_CLIENTS: Dict[tuple, httpx.AsyncClient] = {}
+_CLIENT_REFCOUNTS: Dict[tuple, int] = {}
+
+
+def get_shared_client(key: tuple, headers: Dict[str, str]) -> httpx.AsyncClient:
+    """
+    获取共享的HTTP客户端，不存在时创建
+    
+    Args:
+        key: (代理URL, http2, 超时, 最大连接数, 最大keep-alive连接数, keep-alive过期时间) 组成的键
+        headers: 创建客户端时使用的默认请求头
+        
+    Returns:
+        共享的httpx.AsyncClient
+    """
+    client = _GLOBAL_CLIENTS.get(key)
+    if client is None:
+        (proxy_url, http2, timeout, max_connections,
+         max_keepalive_connections, keepalive_expiry) = key
+        kwargs = {
+            "headers": headers,
+            "timeout": timeout,
+            "verify": False,
+            "follow_redirects": True,
+            "http2": http2,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        }
+        if proxy_url:
+            kwargs["proxies"] = {"http://": proxy_url, "https://": proxy_url}
+        client = httpx.AsyncClient(**kwargs)
+        _GLOBAL_CLIENTS[key] = client
+    _CLIENT_REFCOUNTS[key] = _CLIENT_REFCOUNTS.get(key, 0) + 1
+    return client
+
+
+async def release_shared_client(key: tuple):
+    """释放共享的HTTP客户端，引用计数归零时关闭"""
+    count = _CLIENT_REFCOUNTS.get(key, 0) - 1
+    if count > 0:
+        _CLIENT_REFCOUNTS[key] = count
+        return
+    _CLIENT_REFCOUNTS.pop(key, None)
+    client = _GLOBAL_CLIENTS.pop(key, None)
+    if client is not None:
+        await client.aclose()
@@ -7,14 +7,12 @@ OpenAI Research & News Scraper
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 import cloudscraper
-from bs4 import BeautifulSoup
 from sqlalchemy import select
 
 from crawler.base_scraper import BaseWebScraper
@@ -24,6 +22,15 @@ from crawler import utils
 
 logger = utils.setup_logger()
 
+# class包含content/article的正文容器元素
+_CONTENT_CLASS_RE = re.compile(r'content|article', re.I)
+# class包含author的作者元素
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+# class包含tag的标签元素
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+# 标题包含任一关键词时标记为产品文章（一次扫描匹配全部关键词）
+_PRODUCT_KEYWORD_RE = re.compile(r'gpt|dall-e|whisper|api|product|launch|release', re.I)
+
 
 class OpenAIScraper(BaseWebScraper):
     """OpenAI官网爬虫 - 使用 cloudscraper 绕过反爬保护"""
@@ -33,6 +40,8 @@ class OpenAIScraper(BaseWebScraper):
             base_url="https://openai.com",
             company_name="openai",
             http2=True,
+            requests_per_minute=60,
+            rate_limit_burst=1,
         )
         # OpenAI Chinese URLs（用户指定数据源）
         self.blog_url = "https://openai.com/zh-Hans-CN/news/"
@@ -93,11 +102,14 @@ class OpenAIScraper(BaseWebScraper):
     
     async def fetch_page(self, url: str, **kwargs) -> Optional[str]:
         """异步获取页面内容（包装同步的 cloudscraper）"""
+        # 不经过BaseWebScraper.fetch_page，需自行获取限流令牌
+        await self._rate_limiter.acquire()
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self._executor, self._fetch_sync, url)
     
     async def fetch_json(self, url: str, **kwargs) -> Optional[Dict]:
         """异步获取 JSON 数据"""
+        await self._rate_limiter.acquire()
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self._executor, self._fetch_json_sync, url)
     
@@ -181,7 +193,9 @@ class OpenAIScraper(BaseWebScraper):
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.make_soup(html)
+            # 标题、正文、描述等元素一次遍历取出
+            page = self.collect_page_elements(soup)
             
             article = {
                 'article_id': article_id,
@@ -190,37 +204,31 @@ class OpenAIScraper(BaseWebScraper):
             }
             
             # 标题
-            title_elem = soup.find('h1')
-            if not title_elem:
-                title_elem = soup.find('title')
-            article['title'] = self.clean_text(title_elem.get_text()) if title_elem else ''
+            title_elem = page.get('h1') or page.get('title')
+            article['title'] = self.element_text(title_elem) if title_elem else ''
             
             # 内容 - OpenAI通常使用article标签或main标签
-            content_elem = soup.find('article')
-            if not content_elem:
-                content_elem = soup.find('main')
+            content_elem = page.get('article') or page.get('main')
             if not content_elem:
-                content_elem = soup.find(['div'], class_=lambda x: x and ('content' in str(x).lower() or 'article' in str(x).lower()))
+                content_elem = soup.find(['div'], class_=_CONTENT_CLASS_RE)
             
             article['content'] = self.clean_text(content_elem.get_text()) if content_elem else ''
             
             # 提取参考链接
-            reference_links = self.extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            reference_links = await self.extract_reference_links_async(soup, content_elem)
+            article['reference_links'] = self.dump_json(reference_links)
             
             # 描述/摘要
-            desc_elem = soup.find('meta', attrs={'name': 'description'})
-            if not desc_elem:
-                desc_elem = soup.find('meta', attrs={'property': 'og:description'})
+            desc_elem = page.get('description') or page.get('og:description')
             if desc_elem:
                 article['description'] = desc_elem.get('content', '')
             else:
                 article['description'] = article['content'][:300]
             
             # 作者
-            author_elem = soup.find(['span', 'div', 'p'], class_=lambda x: x and 'author' in str(x).lower())
+            author_elem = soup.find(['span', 'div', 'p'], class_=_AUTHOR_CLASS_RE)
             if not author_elem:
-                author_elem = soup.find('meta', attrs={'name': 'author'})
+                author_elem = page.get('author')
                 article['author'] = author_elem.get('content', '') if author_elem else 'OpenAI'
             else:
                 article['author'] = self.clean_text(author_elem.get_text())
@@ -244,32 +252,32 @@ class OpenAIScraper(BaseWebScraper):
                 logger.warning(f"Skip article {article_id}: cannot parse publish time: {time_str}")
                 return None
             article['publish_time'] = publish_ts
-            article['publish_date'] = datetime.fromtimestamp(publish_ts).strftime('%Y-%m-%d')
+            article['publish_date'] = utils.format_date(publish_ts)
             
             # 分类和标签
             article['category'] = 'AI Research' if '/research/' in url else 'AI News'
             
             # 标签
-            tag_elements = soup.find_all(['a', 'span'], class_=lambda x: x and 'tag' in str(x).lower())
+            tag_elements = soup.find_all(['a', 'span'], class_=_TAG_CLASS_RE)
             tags = []
             for tag_elem in tag_elements:
                 tag_text = self.clean_text(tag_elem.get_text())
                 if tag_text and len(tag_text) < 50:
                     tags.append(tag_text)
-            article['tags'] = json.dumps(tags, ensure_ascii=False) if tags else ''
+            article['tags'] = self.dump_json(tags)
             
             # 封面图片
-            img_elem = soup.find('meta', attrs={'property': 'og:image'})
+            img_elem = page.get('og:image')
             if img_elem:
                 article['cover_image'] = img_elem.get('content', '')
             else:
-                img_elem = soup.find('img')
+                img_elem = page.get('img')
                 article['cover_image'] = img_elem.get('src', '') if img_elem else ''
             
             # 文章类型判断
             article['article_type'] = 'research' if '/research/' in url else 'blog'
             article['is_research'] = 1 if article['article_type'] == 'research' else 0
-            article['is_product'] = 1 if any(keyword in article['title'].lower() for keyword in ['gpt', 'dall-e', 'whisper', 'api', 'product', 'launch', 'release']) else 0
+            article['is_product'] = 1 if _PRODUCT_KEYWORD_RE.search(article['title']) else 0
             
             return article
         
@@ -278,6 +286,53 @@ class OpenAIScraper(BaseWebScraper):
             return None
 
 
+# 字段长度限制映射（根据数据库模型定义）
+_COMPANY_FIELD_LENGTH_LIMITS = {
+    'article_id': 255,
+    'company': 100,
+    'author': 255,
+    'publish_date': 10,
+    'category': 100,
+    'cover_image': 512,
+    'article_type': 50,
+}
+
+
+def _truncate_field(key: str, value):
+    """截断字段值到指定长度"""
+    if key in _COMPANY_FIELD_LENGTH_LIMITS and value is not None:
+        if isinstance(value, str):
+            max_length = _COMPANY_FIELD_LENGTH_LIMITS[key]
+            if len(value) > max_length:
+                return value[:max_length]
+    return value
+
+
+def _apply_company_article(session, existing: Optional[CompanyArticle], article: Dict):
+    """把文章写入会话：已存在则更新字段，否则新增"""
+    article_id = article.get('article_id')
+    
+    if existing:
+        existing.last_modify_ts = utils.get_current_timestamp()
+        for key, value in article.items():
+            if hasattr(existing, key) and key not in ['id', 'add_ts']:
+                setattr(existing, key, _truncate_field(key, value))
+        logger.info(f"Updated company article: {article_id}")
+    else:
+        article['add_ts'] = utils.get_current_timestamp()
+        article['last_modify_ts'] = utils.get_current_timestamp()
+        
+        valid_keys = {c.name for c in CompanyArticle.__table__.columns}
+        filtered_article = {}
+        for k, v in article.items():
+            if k in valid_keys:
+                filtered_article[k] = _truncate_field(k, v)
+        
+        db_article = CompanyArticle(**filtered_article)
+        session.add(db_article)
+        logger.info(f"Saved new company article: {article_id}")
+
+
 async def save_company_article_to_db(article: Dict):
     """保存公司文章到数据库"""
     async with get_session() as session:
@@ -287,46 +342,109 @@ async def save_company_article_to_db(article: Dict):
         result = await session.execute(stmt)
         existing = result.scalar_one_or_none()
         
-        # 字段长度限制映射（根据数据库模型定义）
-        field_length_limits = {
-            'article_id': 255,
-            'company': 100,
-            'author': 255,
-            'publish_date': 10,
-            'category': 100,
-            'cover_image': 512,
-            'article_type': 50,
-        }
+        _apply_company_article(session, existing, article)
+
+
+async def save_company_articles_bulk(articles: List[Dict]):
+    """
+    批量保存公司文章：一次查询已存在的文章，一个事务内更新/插入全部文章
+    
+    Args:
+        articles: 文章列表
+    """
+    if not articles:
+        return
+    
+    # 同一article_id只保留最后一篇，与逐篇保存时后者覆盖前者一致
+    articles_by_id = {article.get('article_id'): article for article in articles}
+    
+    async with get_session() as session:
+        article_ids = list(articles_by_id)
         
-        def truncate_field(key: str, value):
-            """截断字段值到指定长度"""
-            if key in field_length_limits and value is not None:
-                if isinstance(value, str):
-                    max_length = field_length_limits[key]
-                    if len(value) > max_length:
-                        return value[:max_length]
-            return value
+        stmt = select(CompanyArticle).where(CompanyArticle.article_id.in_(article_ids))
+        result = await session.execute(stmt)
+        existing_by_id = {row.article_id: row for row in result.scalars()}
         
-        if existing:
-            existing.last_modify_ts = utils.get_current_timestamp()
-            for key, value in article.items():
-                if hasattr(existing, key) and key not in ['id', 'add_ts']:
-                    truncated_value = truncate_field(key, value)
-                    setattr(existing, key, truncated_value)
-            logger.info(f"Updated company article: {article_id}")
-        else:
-            article['add_ts'] = utils.get_current_timestamp()
-            article['last_modify_ts'] = utils.get_current_timestamp()
-            
-            valid_keys = {c.name for c in CompanyArticle.__table__.columns}
-            filtered_article = {}
-            for k, v in article.items():
-                if k in valid_keys:
-                    filtered_article[k] = truncate_field(k, v)
-            
-            db_article = CompanyArticle(**filtered_article)
-            session.add(db_article)
-            logger.info(f"Saved new company article: {article_id}")
+        for article_id, article in articles_by_id.items():
+            _apply_company_article(session, existing_by_id.get(article_id), article)
+
+
+async def _save_company_articles(articles: List[Dict], label: str) -> List[Dict]:
+    """批量保存，失败时逐篇保存，返回实际写入的文章（同一article_id只计一次）"""
+    # 与批量保存一致，同一article_id只保留最后一篇
+    unique_articles = list({article.get('article_id'): article for article in articles}.values())
+    try:
+        await save_company_articles_bulk(unique_articles)
+        return unique_articles
+    except Exception as e:
+        logger.error(f"Bulk save of {label} articles failed, saving one by one: {e}")
+    
+    saved = []
+    for article in unique_articles:
+        try:
+            await save_company_article_to_db(article)
+            saved.append(article)
+        except Exception as e:
+            logger.error(f"Error saving {label} article {article.get('article_id')}: {e}")
+    return saved
+
+
+async def process_company_articles(scraper: BaseWebScraper, article_items: List[Dict], days: int,
+                                   label: str, concurrency: int = 4) -> int:
+    """
+    并发抓取文章详情，完成后批量保存到数据库
+    
+    同一时间最多concurrency个详情请求在途；请求频率由爬虫的requests_per_minute令牌桶限制
+    （BaseWebScraper.fetch_page和OpenAIScraper的cloudscraper请求都会先获取令牌）。
+    
+    Args:
+        scraper: 爬虫实例
+        article_items: get_article_list返回的文章列表
+        days: 只保存最近days天内的文章（0表示不过滤）
+        label: 日志中使用的来源名称
+        concurrency: 最大并发数
+        
+    Returns:
+        保存的文章数
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    # 列表页嵌套容器可能重复给出同一篇文章，并发保存前去重，避免同一article_id重复插入
+    unique_items: Dict[str, Dict] = {}
+    for article_item in article_items:
+        unique_items.setdefault(article_item['article_id'], article_item)
+    
+    async def process_one(article_item: Dict) -> Optional[Dict]:
+        async with semaphore:
+            try:
+                article = await scraper.get_article_detail(
+                    article_item['article_id'],
+                    article_item['url']
+                )
+                
+                if not article:
+                    return None
+                
+                # 检查日期
+                if days > 0:
+                    article_ts = article['publish_time']
+                    now_ts = datetime.now().timestamp()
+                    if article_ts > now_ts + 86400:
+                        logger.warning(f"Skip article {article['title']}: future date ({article['publish_date']})")
+                        return None
+                    if now_ts - article_ts > days * 86400:
+                        logger.info(f"Skip article {article['title']}: too old ({article['publish_date']})")
+                        return None
+                
+                return article
+                
+            except Exception as e:
+                logger.error(f"Error processing {label} article: {e}")
+                return None
+    
+    results = await asyncio.gather(*(process_one(item) for item in unique_items.values()))
+    # 详情全部抓取完成后一次性写库，减少数据库往返
+    saved = await _save_company_articles([article for article in results if article], label)
+    return len(saved)
 
 
 async def run_openai_crawler(days: int = 7):
@@ -340,6 +458,8 @@ async def run_openai_crawler(days: int = 7):
     
     blog_saved_count = 0
     research_saved_count = 0
+    # 通过日期过滤的文章，抓取结束后批量写库
+    to_save: List[Dict] = []
     
     try:
         # 使用官方 API 获取文章列表
@@ -380,18 +500,16 @@ async def run_openai_crawler(days: int = 7):
                                 logger.info(f"Skip article {article['title']}: too old ({article['publish_date']})")
                                 continue
 
-                        await save_company_article_to_db(article)
-                        if article['article_type'] == 'research':
-                            research_saved_count += 1
-                        else:
-                            blog_saved_count += 1
-                    
-                    await asyncio.sleep(1)  # 礼貌延迟
+                        to_save.append(article)
                     
                 except Exception as e:
                     logger.error(f"Error processing OpenAI article: {e}")
                     continue
         
+            saved = await _save_company_articles(to_save, 'OpenAI')
+            research_saved_count = sum(1 for article in saved if article['article_type'] == 'research')
+            blog_saved_count = len(saved) - research_saved_count
+        
         # 汇总
         total_saved = blog_saved_count + research_saved_count
         logger.info(f"✅ OpenAI Crawler: Successfully saved {total_saved} articles (blog: {blog_saved_count}, research: {research_saved_count})")
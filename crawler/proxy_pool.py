@@ -27,6 +27,9 @@ class ProxyPool:
         self.proxies = proxies or []
         self.failed_proxies = {}  # 失败的代理及其失败时间
         self.retry_after = 300  # 失败后多久可以重试（秒）
+        self.scores: Dict[str, float] = {}  # 代理健康分（成功率的指数移动平均，初始为1）
+        self.score_decay = 0.9  # 健康分的衰减系数
+        self.tier_width = 0.1  # 与最高分相差不超过该值的代理视为同一档，在档内随机选择
     
     def add_proxy(self, proxy: str):
         """添加代理"""
@@ -45,9 +48,19 @@ class ProxyPool:
             self.proxies.remove(proxy)
             logger.info(f"Removed proxy: {proxy}")
     
+    def _update_score(self, proxy: str, success: bool):
+        """更新代理健康分：score = decay * score + (1 - decay) * success"""
+        score = self.scores.get(proxy, 1.0)
+        self.scores[proxy] = self.score_decay * score + (1 - self.score_decay) * (1.0 if success else 0.0)
+    
+    def mark_success(self, proxy: str):
+        """标记代理请求成功"""
+        self._update_score(proxy, True)
+    
     def mark_failed(self, proxy: str):
         """标记代理失败"""
         self.failed_proxies[proxy] = datetime.now()
+        self._update_score(proxy, False)
         logger.warning(f"Marked proxy as failed: {proxy}")
     
     def is_available(self, proxy: str) -> bool:
@@ -64,14 +77,16 @@ class ProxyPool:
         return False
     
     def get_proxy(self) -> Optional[str]:
-        """获取一个可用的代理"""
+        """获取一个可用的代理（优先从健康分最高的一档中随机选择）"""
         available_proxies = [p for p in self.proxies if self.is_available(p)]
         
         if not available_proxies:
             logger.warning("No available proxies in pool")
             return None
         
-        return random.choice(available_proxies)
+        best = max(self.scores.get(p, 1.0) for p in available_proxies)
+        top_tier = [p for p in available_proxies if self.scores.get(p, 1.0) >= best - self.tier_width]
+        return random.choice(top_tier)
     
     def get_proxy_dict(self) -> Optional[Dict[str, str]]:
         """获取代理配置字典（用于httpx）"""
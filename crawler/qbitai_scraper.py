@@ -6,7 +6,6 @@ Crawls articles from https://www.qbitai.com and stores them in the database.
 """
 
 import asyncio
-import json
 import re
 import sys
 from datetime import datetime, timedelta
@@ -14,16 +13,65 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 from sqlalchemy import select
 
 from database.models import QbitaiArticle
 from database.db_session import get_session
 from crawler import utils
+from crawler.base_scraper import dump_json, make_soup
 
 # Initialize logger
 logger = utils.setup_logger()
 
+# 文本中的URL：末尾字符排除标点，无需再逐个rstrip
+_URL_RE = re.compile(r'https?://[^\s<>\[\]"\'\u4e00-\u9fa5]*[^\s<>\[\]"\'\u4e00-\u9fa5.,;:。，；：]')
+# 参考链接分类：按域名关键词依次匹配论文、代码、官方、社交平台
+_PAPER_DOMAIN_RE = re.compile('|'.join(map(re.escape, (
+    'arxiv.org', 'paperswithcode.com', 'semanticscholar.org', 'acm.org', 'ieee.org'))))
+_CODE_DOMAIN_RE = re.compile('|'.join(map(re.escape, ('github.com', 'gitlab.com', 'huggingface.co'))))
+_OFFICIAL_DOMAIN_RE = re.compile('|'.join(map(re.escape, (
+    'blog.', 'medium.com', 'openai.com', 'google.com', 'microsoft.com', 'meta.com', 'nvidia.com',
+    'apple.com', 'aws.amazon.com'))))
+_SOCIAL_DOMAIN_RE = re.compile('|'.join(map(re.escape, (
+    'twitter.com', 'x.com', 'zhihu.com', 'youtube.com', 'bilibili.com'))))
+# 社交平台的分享意图链接
+_SHARE_LINK_RE = re.compile('|'.join(map(re.escape, ('share', 'intent/tweet', 'sharer'))))
+# 不作为参考来源的社交平台
+_EXCLUDED_SOCIAL_RE = re.compile('|'.join(map(re.escape, ('facebook.com', 'weibo.com', 'qzone.qq.com', 'douban.com'))))
+# 列表页文章容器的class（没有div.picture_text时使用）
+_LIST_CLASS_RE = re.compile(r'article|news|post|item', re.I)
+# 列表项中的文章链接
+_ARTICLE_HREF_RE = re.compile(r'article|news')
+# 详情页各字段所在元素的class
+_TITLE_CLASS_RE = re.compile(r'title', re.I)
+_CONTENT_CLASS_RE = re.compile(r'content|article-body|main', re.I)
+_DESC_CLASS_RE = re.compile(r'desc|summary|intro', re.I)
+_AUTHOR_CLASS_RE = re.compile(r'author', re.I)
+_TIME_CLASS_RE = re.compile(r'time|date|pub', re.I)
+_CATEGORY_CLASS_RE = re.compile(r'category|cat', re.I)
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+_COVER_CLASS_RE = re.compile(r'cover|featured', re.I)
+# 文章ID提取规则（按优先级）
+_ARTICLE_ID_PATTERNS = tuple(re.compile(p) for p in (
+    r'/article/(\d+)',
+    r'/news/(\d+)',
+    r'/(\d+)\.html',
+    r'/article/([^/]+)',
+    r'article[=/]([^&/?]+)',
+))
+# 相对时间：N分钟前/小时前/天前
+_REL_TIME_RE = re.compile(r'(\d*)\s*(分钟|小时|天)前')
+_REL_TIME_UNITS = {'分钟': 'minutes', '小时': 'hours', '天': 'days'}
+_TIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y年%m月%d日 %H:%M:%S',
+    '%Y年%m月%d日',
+    '%Y-%m-%d',
+)
+
 class QbitaiWebScraper:
     """Direct scraper for QbitAI website."""
     
@@ -68,21 +116,22 @@ class QbitaiWebScraper:
             if not html:
                 return []
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             articles = []
             
-            # Find article elements (div.picture_text is common on QbitAI)
-            article_elements = soup.find_all('div', class_='picture_text')
+            # Find article elements (div.picture_text is common on QbitAI); only the first 20 are used,
+            # so stop walking the document once that many are found
+            article_elements = soup.find_all('div', class_='picture_text', limit=20)
             
             if not article_elements:
-                article_elements = soup.find_all(class_=re.compile(r'article|news|post|item', re.I))
+                article_elements = soup.find_all(class_=_LIST_CLASS_RE, limit=20)
             
             if not article_elements:
-                article_elements = soup.select('a[href*="/article"], a[href*="/news"]')
+                article_elements = soup.select('a[href*="/article"], a[href*="/news"]', limit=20)
             
             logger.info(f"Found {len(article_elements)} potential article elements")
             
-            for elem in article_elements[:20]:
+            for elem in article_elements:
                 try:
                     if 'picture_text' in elem.get('class', []):
                         title_elem = elem.select_one('.text_box h4 a')
@@ -98,7 +147,7 @@ class QbitaiWebScraper:
                         title_elem = elem.find(['h2', 'h3', 'h4', 'a'])
                         title = title_elem.get_text(strip=True) if title_elem else ''
                         
-                        link_elem = elem.find('a', href=re.compile(r'article|news'))
+                        link_elem = elem.find('a', href=_ARTICLE_HREF_RE)
                         url = link_elem.get('href', '') if link_elem else ''
                     
                     if not url or not title:
@@ -137,7 +186,7 @@ class QbitaiWebScraper:
             if not html:
                 return None
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             article = {
                 'article_id': article_id,
@@ -148,7 +197,7 @@ class QbitaiWebScraper:
             title_elem = soup.find('h1')
             if not title_elem:
                 # 后备方案：查找包含title类的标题
-                title_elem = soup.find(['h1', 'h2'], class_=re.compile(r'title', re.I))
+                title_elem = soup.find(['h1', 'h2'], class_=_TITLE_CLASS_RE)
             if not title_elem:
                 # 最后尝试从title标签提取
                 title_tag = soup.find('title')
@@ -162,23 +211,23 @@ class QbitaiWebScraper:
                 article['title'] = title_elem.get_text(strip=True)
             
             # Content
-            content_elem = soup.find(class_=re.compile(r'content|article-body|main', re.I))
+            content_elem = soup.find(class_=_CONTENT_CLASS_RE)
             article['content'] = content_elem.get_text(strip=True) if content_elem else ''
             
             # Extract reference links from article content
             reference_links = self._extract_reference_links(soup, content_elem)
-            article['reference_links'] = json.dumps(reference_links, ensure_ascii=False) if reference_links else ''
+            article['reference_links'] = dump_json(reference_links)
             
             # Description
-            desc_elem = soup.find(class_=re.compile(r'desc|summary|intro', re.I))
+            desc_elem = soup.find(class_=_DESC_CLASS_RE)
             article['description'] = desc_elem.get_text(strip=True) if desc_elem else article['content'][:200]
             
             # Author
-            author_elem = soup.find(class_=re.compile(r'author', re.I))
+            author_elem = soup.find(class_=_AUTHOR_CLASS_RE)
             article['author'] = author_elem.get_text(strip=True) if author_elem else ''
             
             # Publish Time
-            time_elem = soup.find(['time', 'span'], class_=re.compile(r'time|date|pub', re.I))
+            time_elem = soup.find(['time', 'span'], class_=_TIME_CLASS_RE)
             if not time_elem:
                 time_elem = soup.find('meta', attrs={'property': 'article:published_time'})
                 time_str = time_elem.get('content') if time_elem else datetime.now().isoformat()
@@ -190,22 +239,22 @@ class QbitaiWebScraper:
                 logger.warning(f"Skip article {article_id} due to missing/invalid publish time.")
                 return None
             article['publish_time'] = publish_ts
-            article['publish_date'] = datetime.fromtimestamp(article['publish_time']).strftime('%Y-%m-%d')
+            article['publish_date'] = utils.format_date(article['publish_time'])
             
             # Category
-            cat_elem = soup.find(class_=re.compile(r'category|cat', re.I))
+            cat_elem = soup.find(class_=_CATEGORY_CLASS_RE)
             article['category'] = cat_elem.get_text(strip=True) if cat_elem else ''
             
             # Tags
             tags = []
-            for tag_elem in soup.find_all(class_=re.compile(r'tag', re.I)):
+            for tag_elem in soup.find_all(class_=_TAG_CLASS_RE):
                 tag_text = tag_elem.get_text(strip=True)
                 if tag_text:
                     tags.append(tag_text)
-            article['tags'] = json.dumps(tags, ensure_ascii=False) if tags else ''
+            article['tags'] = dump_json(tags)
             
             # Cover Image
-            img_elem = soup.find('img', class_=re.compile(r'cover|featured', re.I))
+            img_elem = soup.find('img', class_=_COVER_CLASS_RE)
             article['cover_image'] = img_elem.get('src') if img_elem else ''
             
             # Source Keyword
@@ -235,24 +284,27 @@ class QbitaiWebScraper:
             return reference_links
             
         candidates = [] 
+        text_parts = []
+        # 与get_text()相同的文本节点类型（跳过注释、脚本等）
+        text_types = getattr(content_elem, 'interesting_string_types', (NavigableString, CData))
+        if isinstance(text_types, type):
+            text_types = (text_types,)
 
-        # 1. 提取<a>标签中的链接
-        for link in content_elem.find_all('a', href=True):
-            href = link.get('href', '').strip()
-            text = link.get_text(strip=True)
-            if href:
-                candidates.append((href, text or href))
+        # 一次遍历同时收集<a>标签和文本内容
+        for node in content_elem.descendants:
+            if isinstance(node, Tag):
+                # 1. 提取<a>标签中的链接
+                if node.name == 'a' and node.get('href') is not None:
+                    href = node.get('href', '').strip()
+                    if href:
+                        candidates.append((href, node.get_text(strip=True) or href))
+            elif type(node) in text_types:
+                text_parts.append(node)
 
         # 2. 提取文本内容中的链接 (处理非超链接形式的URL)
-        text_content = content_elem.get_text()
-        # 匹配http/https开头，直到遇到空白、括号、引号或中文字符
-        url_pattern = re.compile(r'https?://[^\s<>\[\]"\'\u4e00-\u9fa5]+')
-        text_urls = url_pattern.findall(text_content)
-        
-        for url in text_urls:
-            # 清理可能的末尾标点
-            url = url.rstrip('.,;:。，；：')
-            candidates.append((url, url))
+        text_content = ''.join(text_parts)
+        # 匹配http/https开头，直到遇到空白、括号、引号或中文字符（不含末尾标点）
+        candidates.extend((m.group(0), m.group(0)) for m in _URL_RE.finditer(text_content))
         
         # 去重和过滤
         seen_urls = set()
@@ -279,26 +331,26 @@ class QbitaiWebScraper:
             href_lower = href.lower()
             
             # 论文相关
-            if any(domain in href_lower for domain in ['arxiv.org', 'paperswithcode.com', 'semanticscholar.org', 'acm.org', 'ieee.org']):
+            if _PAPER_DOMAIN_RE.search(href_lower):
                 is_reference = True
                 ref_type = 'paper'
             # GitHub/代码仓库
-            elif any(domain in href_lower for domain in ['github.com', 'gitlab.com', 'huggingface.co']):
+            elif _CODE_DOMAIN_RE.search(href_lower):
                 is_reference = True
                 ref_type = 'code'
             # 官方博客/文档/科技巨头
-            elif any(domain in href_lower for domain in ['blog.', 'medium.com', 'openai.com', 'google.com', 'microsoft.com', 'meta.com', 'nvidia.com', 'apple.com', 'aws.amazon.com']):
+            elif _OFFICIAL_DOMAIN_RE.search(href_lower):
                 is_reference = True
                 ref_type = 'official'
             # 社交媒体/内容平台
-            elif any(domain in href_lower for domain in ['twitter.com', 'x.com', 'zhihu.com', 'youtube.com', 'bilibili.com']):
+            elif _SOCIAL_DOMAIN_RE.search(href_lower):
                 # 排除分享意图的链接
-                if not any(k in href_lower for k in ['share', 'intent/tweet', 'sharer']):
+                if not _SHARE_LINK_RE.search(href_lower):
                     is_reference = True
                     ref_type = 'social'
             
             # 其他外部链接
-            elif href.startswith('http') and not any(social in href_lower for social in ['facebook.com', 'weibo.com', 'qzone.qq.com', 'douban.com']):
+            elif href.startswith('http') and not _EXCLUDED_SOCIAL_RE.search(href_lower):
                 is_reference = True
                 ref_type = 'external'
             
@@ -314,15 +366,8 @@ class QbitaiWebScraper:
         return unique_links
 
     def _extract_article_id(self, url: str) -> Optional[str]:
-        patterns = [
-            r'/article/(\d+)',
-            r'/news/(\d+)',
-            r'/(\d+)\.html',
-            r'/article/([^/]+)',
-            r'article[=/]([^&/?]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _ARTICLE_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return url.split('/')[-1].split('.')[0] if url else None
@@ -338,33 +383,19 @@ class QbitaiWebScraper:
             
             if '刚刚' in time_str:
                 return int(now.timestamp())
-            elif '分钟前' in time_str:
-                match = re.search(r'(\d+)', time_str)
-                minutes = int(match.group(1)) if match else 0
-                return int((now - timedelta(minutes=minutes)).timestamp())
-            elif '小时前' in time_str:
-                match = re.search(r'(\d+)', time_str)
-                hours = int(match.group(1)) if match else 0
-                return int((now - timedelta(hours=hours)).timestamp())
-            elif '天前' in time_str:
-                match = re.search(r'(\d+)', time_str)
-                days = int(match.group(1)) if match else 0
-                return int((now - timedelta(days=days)).timestamp())
-            elif '昨天' in time_str:
+            
+            # 一次匹配同时取出数字和单位
+            match = _REL_TIME_RE.search(time_str)
+            if match:
+                delta = timedelta(**{_REL_TIME_UNITS[match.group(2)]: int(match.group(1) or 0)})
+                return int((now - delta).timestamp())
+            
+            if '昨天' in time_str:
                 return int((now - timedelta(days=1)).timestamp())
             elif '前天' in time_str:
                 return int((now - timedelta(days=2)).timestamp())
             
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M',
-                '%Y/%m/%d %H:%M:%S',
-                '%Y年%m月%d日 %H:%M:%S',
-                '%Y年%m月%d日',
-                '%Y-%m-%d',
-            ]
-            
-            for fmt in formats:
+            for fmt in _TIME_FORMATS:
                 try:
                     dt = datetime.strptime(time_str[:19], fmt)
                     return int(dt.timestamp())
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import logging
 import sys
@@ -7,6 +8,11 @@ def get_current_timestamp():
     """Returns current unix timestamp in seconds (int)."""
     return int(time.time())
 
+def format_date(timestamp):
+    """Formats a unix timestamp as a local 'YYYY-MM-DD' string without building a datetime."""
+    t = time.localtime(timestamp)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
 def setup_logger():
     """Configures loguru logger."""
     logger.remove()
@@ -17,3 +23,15 @@ def setup_logger():
     )
     return logger
 
+
+def run_async(main):
+    """Runs a coroutine on a uvloop event loop if uvloop is available, otherwise with asyncio.run."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    # uvloop.run replaces the deprecated uvloop.install() event loop policy (uvloop>=0.18)
+    uvloop_run = getattr(uvloop, 'run', None)
+    if uvloop_run is None:
+        return asyncio.run(main)
+    return uvloop_run(main)
@@ -6,7 +6,6 @@ AIReport Main Entry Point
 2. Generate Weekly/Daily Report
 """
 
-import asyncio
 import argparse
 from crawler.scheduler import run_all_crawlers, CrawlerScheduler
 from crawler import get_global_registry, CrawlerType
@@ -108,7 +107,8 @@ async def run_single_crawler(crawler_name: str, days: int):
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # 可选：安装了uvloop时使用其事件循环，降低高并发抓取的系统调用开销
+        utils.run_async(main())
     except KeyboardInterrupt:
         logger.warning("Interrupted by user.")
     except Exception as e: